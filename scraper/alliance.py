@@ -1,9 +1,10 @@
-import pandas as pd
-import httpx 
-import sys 
-from bs4 import BeautifulSoup
+import asyncio
+import logging
+from selectolax.lexbor import LexborHTMLParser
 from .base import BaseScraper                # <-- FIXED: Now a simple relative import
-from .utils import clean_rate, parse_term_to_months # <-- FIXED: Now a simple relative import
+from .utils import clean_rate, parse_term_to_months, new_rate_columns, append_rate, extract_rows # <-- FIXED: Now a simple relative import
+
+logger = logging.getLogger('scraper')
 
 class AllianceScraper(BaseScraper):
     def __init__(self):
@@ -13,40 +14,44 @@ class AllianceScraper(BaseScraper):
             url='https://www.alliancefinance.lk/investments/fixed-deposits/'
         )
 
-    async def scrape(self) -> pd.DataFrame:
+    async def scrape(self) -> list[dict]:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-                response.raise_for_status()
+            response = await self.fetch_page()
+            if self.unchanged or self.page_unchanged(response.content):
+                return []
 
-            soup = BeautifulSoup(response.content, 'lxml')
-            table = soup.find('table', id='tablepress-1')
-            
-            if not table:
-                print(f"--- FAILED: {self.name} - Could not find rates table.")
-                return pd.DataFrame()
+            # Parsing is CPU-bound, so run it in a thread to keep the event loop
+            # free for the other scrapers' downloads
+            return await asyncio.to_thread(self._parse, response.text)
+
+        except Exception as e:
+            logger.error("--- FAILED: %s scraper threw an error. --- \nError: %s", self.name, e)
+            raise e
 
-            all_rates_data = []
-            for row in table.select('tbody > tr'):
-                cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-                if len(cells) != 5: continue
-                
-                term_months = parse_term_to_months(cells[0])
-                if not term_months: continue
-                
-                if monthly_rate := clean_rate(cells[1]):
-                    all_rates_data.append({'Bank Name': self.name, 'FD Type': 'Standard', 'Institution Type': self.institution_type, 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-                
-                if maturity_rate := clean_rate(cells[3]):
-                    all_rates_data.append({'Bank Name': self.name, 'FD Type': 'Standard', 'Institution Type': self.institution_type, 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
+    def _parse(self, html: str) -> list[dict]:
+        tree = LexborHTMLParser(html)
+        table = tree.css_first('table#tablepress-1')
+        
+        if not table:
+            logger.warning("--- FAILED: %s - Could not find rates table.", self.name)
+            return []
+
+        cols = new_rate_columns()
+        # Local aliases so the row loop uses fast local lookups instead of globals
+        clean, parse_term, append = clean_rate, parse_term_to_months, append_rate
+        for cells in extract_rows(table, 5):
+            term_months = parse_term(cells[0])
+            if not term_months: continue
             
-            if not all_rates_data:
-                print(f"--- FAILED: {self.name} - No data extracted.")
-                return pd.DataFrame()
+            if monthly_rate := clean(cells[1]):
+                append(cols, 'Standard', term_months, 'Monthly', monthly_rate, clean(cells[2]))
             
-            print(f"--- SUCCESS: {self.name} extracted {len(all_rates_data)} records.")
-            return pd.DataFrame(all_rates_data)
-
-        except Exception as e:
-            print(f"--- FAILED: {self.name} scraper threw an error. --- \nError: {e}", file=sys.stderr)
-            raise e
\ No newline at end of file
+            if maturity_rate := clean(cells[3]):
+                append(cols, 'Standard', term_months, 'At Maturity', maturity_rate, clean(cells[4]))
+        
+        if not cols['Term (Months)']:
+            logger.warning("--- FAILED: %s - No data extracted.", self.name)
+            return []
+        
+        logger.info("--- SUCCESS: %s extracted %d records.", self.name, len(cols['Term (Months)']))
+        return self.to_records(cols)
\ No newline at end of file
@@ -1,10 +1,68 @@
-import pandas as pd
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import httpx
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright, Route
+
+logger = logging.getLogger('scraper')
+
+# Where page hashes and HTTP validators from the last successful run are kept between runs
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'fd-scraper', 'cache.json')
+# Bump when a parser or upload change should reach Supabase even for pages that
+# haven't changed; a cache written under another version is discarded
+CACHE_VERSION = 1
+# The cache is also discarded once it is this old (in seconds), so every page is
+# re-uploaded now and then and rows edited or removed in the database come back
+CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# Failed connects are retried by the transport; responses in RETRY_STATUSES are
+# retried by fetch_page after 0.5s, 1s, 2s, ...
+HTTP_RETRIES = 3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF = 0.5
+
+# Resource types no scraper reads (only the HTML is parsed), so pages skip downloading them
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'stylesheet', 'font', 'media'})
+
+# Third-party analytics and ad hosts; none of them render anything a scraper reads
+BLOCKED_URL_RE = re.compile(
+    r'^https?://(?:[^/]*\.)?(?:googletagmanager\.com|google-analytics\.com|doubleclick\.net'
+    r'|facebook\.net|hotjar\.com|segment\.(?:com|io)|clarity\.ms)(?:[:/]|$)'
+)
+
+async def block_unused_resources(route: Route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.match(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
 
 class BaseScraper:
     """
     The 'parent' class that all specific scrapers will inherit from.
     It holds the common logic and a blueprint for what all scrapers must have.
     """
+
+    # One pooled HTTP client shared by every scraper, so connections to the
+    # same host are kept alive and reused instead of re-handshaking each time.
+    _client: httpx.AsyncClient | None = None
+
+    # Likewise, one Chromium instance is shared by every Playwright scraper;
+    # each scraper gets its own lightweight BrowserContext instead.
+    _playwright: Playwright | None = None
+    _browser: Browser | None = None
+    _browser_lock = asyncio.Lock()
+
+    # Loaded from CACHE_FILE on first use (empty if it is stale, see CACHE_VERSION):
+    #   'version':     CACHE_VERSION it was written under
+    #   'created':     time.time() when it was started
+    #   'page_hashes': {scraper name: hash of the page it last uploaded}
+    #   'validators':  {url: {'etag': ..., 'last_modified': ...}} of that page
+    _cache: dict | None = None
     
     def __init__(self, name: str, institution_type: str, url: str):
         """
@@ -14,10 +72,157 @@ class BaseScraper:
         self.name = name
         self.institution_type = institution_type
         self.url = url
-        # This print statement is great for logging in GitHub Actions
-        print(f"--- Starting: {self.name} ---")
+        # Set by fetch_page() / page_unchanged() once the page has been fetched
+        self.page_hash = None
+        self.page_validators = None
+        self.unchanged = False
+        # This log line is great for following along in GitHub Actions
+        logger.info("--- Starting: %s ---", self.name)
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """
+        Returns the shared httpx client, creating it on first use.
+        """
+        if BaseScraper._client is None or BaseScraper._client.is_closed:
+            BaseScraper._client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    retries=HTTP_RETRIES,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    http2=True,
+                ),
+                headers={'User-Agent': 'Mozilla/5.0'},
+                timeout=httpx.Timeout(20.0),
+            )
+        return BaseScraper._client
+
+    @classmethod
+    async def close_client(cls):
+        """
+        Closes the shared httpx client. Call this once when the pipeline shuts down.
+        """
+        if BaseScraper._client is not None:
+            await BaseScraper._client.aclose()
+            BaseScraper._client = None
+
+    @classmethod
+    async def get_browser(cls) -> Browser:
+        """
+        Returns the shared headless Chromium browser, launching it on first use.
+        The lock stops two scrapers starting at once from launching two browsers.
+        """
+        async with BaseScraper._browser_lock:
+            if BaseScraper._browser is None or not BaseScraper._browser.is_connected():
+                if BaseScraper._playwright is None:
+                    BaseScraper._playwright = await async_playwright().start()
+                BaseScraper._browser = await BaseScraper._playwright.chromium.launch(headless=True)
+        return BaseScraper._browser
+
+    @classmethod
+    async def new_context(cls) -> BrowserContext:
+        """
+        Opens an isolated context on the shared browser that aborts image, stylesheet,
+        font, media and tracker requests. The caller closes it when done.
+        """
+        browser = await cls.get_browser()
+        context = await browser.new_context(viewport={'width': 800, 'height': 600})
+        await context.route('**/*', block_unused_resources)
+        return context
 
-    async def scrape(self) -> pd.DataFrame:
+    @classmethod
+    async def close_browser(cls):
+        """
+        Closes the shared browser and stops Playwright. Call this once when the pipeline shuts down.
+        """
+        if BaseScraper._browser is not None:
+            await BaseScraper._browser.close()
+            BaseScraper._browser = None
+        if BaseScraper._playwright is not None:
+            await BaseScraper._playwright.stop()
+            BaseScraper._playwright = None
+
+    @classmethod
+    def _get_cache(cls) -> dict:
+        if BaseScraper._cache is None:
+            try:
+                with open(CACHE_FILE) as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            if cache.get('version') != CACHE_VERSION or time.time() - cache.get('created', 0) > CACHE_MAX_AGE:
+                cache = {'version': CACHE_VERSION, 'created': time.time()}
+            BaseScraper._cache = cache
+            BaseScraper._cache.setdefault('page_hashes', {})
+            BaseScraper._cache.setdefault('validators', {})
+        return BaseScraper._cache
+
+    @classmethod
+    def save_cache(cls):
+        """
+        Writes the page hashes and validators back to CACHE_FILE. Call this once at the end of a run.
+        """
+        if BaseScraper._cache is None:
+            return
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, 'w') as f:
+            json.dump(BaseScraper._cache, f)
+
+    async def fetch_page(self) -> httpx.Response:
+        """
+        GETs self.url with the shared client. If the last uploaded fetch had an
+        ETag / Last-Modified, they are sent back so an unchanged page comes back
+        as an empty 304, in which case self.unchanged is set. Throttled and
+        server-error responses are retried with exponential backoff.
+        """
+        headers = {}
+        if validators := self._get_cache()['validators'].get(self.url):
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        client = self.get_client()
+        for attempt in range(HTTP_RETRIES):
+            response = await client.get(self.url, headers=headers)
+            if response.status_code not in RETRY_STATUSES:
+                break
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+        else:
+            response = await client.get(self.url, headers=headers)
+        if response.status_code == 304:
+            self.unchanged = True
+            return response
+        response.raise_for_status()
+
+        # Like the page hash, these are only stored once the upload succeeds
+        self.page_validators = {
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified')
+        }
+        return response
+
+    def page_unchanged(self, content: bytes) -> bool:
+        """
+        Hashes the raw page and reports whether it matches the last uploaded one,
+        so the scraper can skip parsing and uploading. The new hash is only
+        stored once its records are uploaded (see remember_page).
+        """
+        self.page_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+        self.unchanged = self._get_cache()['page_hashes'].get(self.name) == self.page_hash
+        return self.unchanged
+
+    def remember_page(self):
+        """
+        Records the current page hash and validators as uploaded, so an identical
+        page is skipped next run.
+        """
+        cache = self._get_cache()
+        if self.page_hash:
+            cache['page_hashes'][self.name] = self.page_hash
+        if self.page_validators:
+            cache['validators'][self.url] = self.page_validators
+
+    async def scrape(self) -> list[dict]:
         """
         This is the main scraping method that each 'child' class must create.
         We make it 'async' so it works with both httpx and Playwright.
@@ -26,6 +231,30 @@ class BaseScraper:
         # in a child scraper, your program will crash with this helpful error.
         raise NotImplementedError(f"{self.name} must have its own .scrape() method!")
 
+    def to_records(self, cols: dict) -> list[dict]:
+        """
+        Turns a column store (see utils.new_rate_columns) into a list of record dicts,
+        adding this scraper's constant 'Bank Name' / 'Institution Type' fields.
+        """
+        name, institution_type = self.name, self.institution_type
+        # Unpacking each row tuple into one dict literal is much cheaper than
+        # building and merging dicts with dict(zip(...)) per record
+        return [
+            {
+                'Bank Name': name,
+                'FD Type': fd_type,
+                'Institution Type': institution_type,
+                'Term (Months)': term_months,
+                'Payout Schedule': payout_schedule,
+                'Interest Rate (p.a.)': rate,
+                'Annual Effective Rate': aer
+            }
+            for fd_type, term_months, payout_schedule, rate, aer in zip(
+                cols['FD Type'], cols['Term (Months)'], cols['Payout Schedule'],
+                cols['Interest Rate (p.a.)'], cols['Annual Effective Rate']
+            )
+        ]
+
     def get_log_data(self) -> dict:
         """
         A helper to return a consistent, default log entry for the dashboard.
@@ -1,10 +1,28 @@
-import pandas as pd
-import httpx 
-import re
-import sys 
-from bs4 import BeautifulSoup
+import asyncio
+import logging
+from selectolax.lexbor import LexborHTMLParser
 from .base import BaseScraper                # <-- FIXED: Now a simple relative import
-from .utils import clean_rate, parse_term_to_months # <-- FIXED: Now a simple relative import
+from .utils import clean_rate, parse_term_to_months, new_rate_columns, append_rate, extract_rows # <-- FIXED: Now a simple relative import
+
+logger = logging.getLogger('scraper')
+
+# Each rates table is the first <table> after the first <p> whose text contains
+# its heading (lowercased). The match is on the paragraph's full text, since the
+# heading is sometimes wrapped in <strong>, which :lexbor-contains doesn't see into
+_STANDARD_HEADING = 'fixed deposits (lkr)'
+_SENIOR_HEADING = 'senior citizen fixed deposits'
+
+# (rate column, AER column or None, payout schedule) for each rate in a standard row
+_STANDARD_LAYOUT = ((1, 2, 'At Maturity'), (3, 4, 'Monthly'), (5, None, 'Annually'))
+# (rate column, payout schedule); the senior citizen table has no AER columns
+_SENIOR_LAYOUT = ((1, 'At Maturity'), (2, 'Monthly'))
+
+def _table_after_heading(paragraphs, heading):
+    header = next((p for p in paragraphs if heading in p.text().lower()), None)
+    node = header.next if header else None
+    while node is not None and node.tag != 'table':
+        node = node.next
+    return node
 
 class CargillsScraper(BaseScraper):
     def __init__(self):
@@ -14,50 +32,50 @@ class CargillsScraper(BaseScraper):
             url='https://www.cargillsbank.com/deposit-interest-rates'
         )
 
-    async def scrape(self) -> pd.DataFrame:
+    async def scrape(self) -> list[dict]:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-                response.raise_for_status()
-                
-            soup = BeautifulSoup(response.content, 'lxml')
-            all_rates_data = []
-            
-            standard_header = soup.find('p', string=re.compile(r'Fixed Deposits \(LKR\)', re.IGNORECASE))
-            if standard_header and (standard_table := standard_header.find_next_sibling('table')):
-                for row in standard_table.select('tbody > tr')[1:]:
-                    cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-                    if len(cells) != 6: continue
-                    term_months = parse_term_to_months(cells[0])
-                    if not term_months: continue
-                    
-                    if rate := clean_rate(cells[1]): 
-                        all_rates_data.append({'Bank Name': self.name, 'FD Type': 'Standard', 'Institution Type': self.institution_type, 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': clean_rate(cells[2])})
-                    if rate := clean_rate(cells[3]): 
-                        all_rates_data.append({'Bank Name': self.name, 'FD Type': 'Standard', 'Institution Type': self.institution_type, 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': clean_rate(cells[4])})
-                    if rate := clean_rate(cells[5]): 
-                        all_rates_data.append({'Bank Name': self.name, 'FD Type': 'Standard', 'Institution Type': self.institution_type, 'Term (Months)': term_months, 'Payout Schedule': 'Annually', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': None})
-
-            senior_header = soup.find('p', string=re.compile(r'Senior Citizen Fixed Deposits', re.IGNORECASE))
-            if senior_header and (senior_table := senior_header.find_next_sibling('table')):
-                for row in senior_table.select('tbody > tr')[1:]:
-                    cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-                    if len(cells) != 3: continue
-                    term_months = parse_term_to_months(cells[0])
-                    if not term_months: continue
-                    
-                    if rate := clean_rate(cells[1]): 
-                        all_rates_data.append({'Bank Name': self.name, 'FD Type': 'Senior Citizen', 'Institution Type': self.institution_type, 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': None})
-                    if rate := clean_rate(cells[2]): 
-                        all_rates_data.append({'Bank Name': self.name, 'FD Type': 'Senior Citizen', 'Institution Type': self.institution_type, 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': None})
-
-            if not all_rates_data:
-                print(f"--- FAILED: {self.name} - No data extracted.")
-                return pd.DataFrame()
-            
-            print(f"--- SUCCESS: {self.name} extracted {len(all_rates_data)} records.")
-            return pd.DataFrame(all_rates_data)
+            response = await self.fetch_page()
+            if self.unchanged or self.page_unchanged(response.content):
+                return []
+
+            # Parsing is CPU-bound, so run it in a thread to keep the event loop
+            # free for the other scrapers' downloads
+            return await asyncio.to_thread(self._parse, response.text)
 
         except Exception as e:
-            print(f"--- FAILED: {self.name} scraper threw an error. --- \nError: {e}", file=sys.stderr)
-            raise e
\ No newline at end of file
+            logger.error("--- FAILED: %s scraper threw an error. --- \nError: %s", self.name, e)
+            raise e
+
+    def _parse(self, html: str) -> list[dict]:
+        tree = LexborHTMLParser(html)
+        paragraphs = tree.css('p')
+        cols = new_rate_columns()
+        # Local aliases so the row loop uses fast local lookups instead of globals
+        clean, parse_term, append = clean_rate, parse_term_to_months, append_rate
+        
+        if standard_table := _table_after_heading(paragraphs, _STANDARD_HEADING):
+            for cells in extract_rows(standard_table, 6, skip_first_row=True):
+                term_months = parse_term(cells[0])
+                if not term_months: continue
+
+                rates = list(map(clean, cells))
+                for rate_col, aer_col, schedule in _STANDARD_LAYOUT:
+                    if rate := rates[rate_col]:
+                        append(cols, 'Standard', term_months, schedule, rate, rates[aer_col] if aer_col else None)
+
+        if senior_table := _table_after_heading(paragraphs, _SENIOR_HEADING):
+            for cells in extract_rows(senior_table, 3, skip_first_row=True):
+                term_months = parse_term(cells[0])
+                if not term_months: continue
+
+                rates = list(map(clean, cells))
+                for rate_col, schedule in _SENIOR_LAYOUT:
+                    if rate := rates[rate_col]:
+                        append(cols, 'Senior Citizen', term_months, schedule, rate, None)
+
+        if not cols['Term (Months)']:
+            logger.warning("--- FAILED: %s - No data extracted.", self.name)
+            return []
+        
+        logger.info("--- SUCCESS: %s extracted %d records.", self.name, len(cols['Term (Months)']))
+        return self.to_records(cols)
\ No newline at end of file
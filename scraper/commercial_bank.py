@@ -1,10 +1,13 @@
-import pandas as pd
+import asyncio
 import re
-import sys
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+import logging
+from selectolax.lexbor import LexborHTMLParser
 from .base import BaseScraper
-from .utils import clean_rate # Only import what's needed
+from .utils import new_rate_columns, append_rate, extract_rows
+
+logger = logging.getLogger('scraper')
+
+_TERM_MONTHS_RE = re.compile(r'(\d+)\s*Months?', re.IGNORECASE)
 
 class CommercialBankScraper(BaseScraper):
     def __init__(self):
@@ -14,50 +17,46 @@ class CommercialBankScraper(BaseScraper):
             url='https://www.combank.lk/rates-tariff'
         )
 
-    async def scrape(self) -> pd.DataFrame:
+    async def scrape(self) -> list[dict]:
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+            context = await self.new_context()
+            try:
+                page = await context.new_page()
                 await page.goto(self.url, wait_until='domcontentloaded', timeout=60000)
                 fd_dropdown_locator = page.locator('a.expand-link:has-text("Fixed Deposits")')
                 await fd_dropdown_locator.wait_for(state="visible", timeout=20000)
                 await fd_dropdown_locator.click()
                 table_selector = 'div.expand-block:has(a:has-text("Fixed Deposits")) table.with-radius'
                 await page.wait_for_selector(table_selector, state='visible', timeout=15000)
-                html_content = await page.content()
-                await browser.close()
-
-            soup = BeautifulSoup(html_content, 'lxml')
-            fd_link = next((link for link in soup.find_all('a', class_='expand-link') if "Fixed Deposits" in link.get_text(separator=" ", strip=True)), None)
-            if not (fd_link and (fd_parent_block := fd_link.find_parent('div', class_='expand-block')) and (table_element := fd_parent_block.find('table', class_='with-radius'))):
-                return pd.DataFrame()
-
-            data_rows = []
-            for row in table_element.select('tbody > tr'):
-                cells = row.find_all('td')
-                if len(cells) != 4: continue
-                try:
-                    description_raw = cells[0].get_text(separator=" ", strip=True)
-                    term_match = re.search(r'(\d+)\s*Months?', description_raw, re.IGNORECASE)
-                    term_months = int(term_match.group(1)) if term_match else None
-                    payout_schedule = 'Monthly' if 'monthly' in description_raw.lower() else 'Annually' if 'annually' in description_raw.lower() else 'At Maturity'
-                    
-                    data_rows.append({
-                        'Bank Name': self.name, 
-                        'FD Type': 'Standard',
-                        'Institution Type': self.institution_type,
-                        'Term (Months)': term_months,
-                        'Payout Schedule': payout_schedule,
-                        'Interest Rate (p.a.)': float(cells[1].get_text(strip=True)),
-                        'Annual Effective Rate': float(cells[2].get_text(strip=True)),
-                    })
-                except (ValueError, IndexError, AttributeError): continue
-
-            if not data_rows:
-                return pd.DataFrame()
-            return pd.DataFrame(data_rows)
-        
+                # Only the rates table is needed, so skip serializing the whole page
+                table_html = await page.locator(table_selector).first.inner_html()
+            finally:
+                await context.close()
+
+            if self.page_unchanged(table_html.encode()):
+                return []
+
+            return await asyncio.to_thread(self._parse, table_html)
+
         except Exception as e:
-            print(f"--- FAILED: {self.name} scraper threw an error. --- \nError: {e}", file=sys.stderr)
-            raise e
\ No newline at end of file
+            logger.error("--- FAILED: %s scraper threw an error. --- \nError: %s", self.name, e)
+            raise e
+
+    def _parse(self, table_html: str) -> list[dict]:
+        table_element = LexborHTMLParser(f"<table>{table_html}</table>").css_first('table')
+        cols = new_rate_columns()
+        for cells in extract_rows(table_element, 4, separator=" "):
+            try:
+                description_raw = cells[0]
+                term_match = _TERM_MONTHS_RE.search(description_raw)
+                term_months = int(term_match.group(1)) if term_match else None
+                payout_schedule = 'Monthly' if 'monthly' in description_raw.lower() else 'Annually' if 'annually' in description_raw.lower() else 'At Maturity'
+                
+                rate = float(cells[1])
+                aer = float(cells[2])
+                append_rate(cols, 'Standard', term_months, payout_schedule, rate, aer)
+            except ValueError: continue
+
+        if not cols['Term (Months)']:
+            return []
+        return self.to_records(cols)
\ No newline at end of file
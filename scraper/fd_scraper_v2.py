@@ -1,86 +1,211 @@
 import asyncio
-import pandas as pd
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
 import re
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import orjson
+from lxml import etree, html
 from playwright.async_api import async_playwright
-import sys
+import time
 import os 
+import logging
 from supabase import create_client, Client 
+from .base import HTTP_RETRIES, RETRY_STATUSES, RETRY_BACKOFF, block_unused_resources
+from .utils import (
+    _NUM_RE, clean_rate, clean_percent_rate, clean_positive_rate, clean_positive_percent_rate,
+    parse_term_to_months, clean_records, replace_institution_rates, use_orjson_encoder, start_logging
+)
+
+logger = logging.getLogger('scraper')
 
 # --- SUPABASE UPLOAD FUNCTION ---
 
-async def update_supabase_for_institution(supabase_client: Client, df: pd.DataFrame, institution_name: str):
+# Caps how many institution uploads talk to Supabase at the same time
+MAX_CONCURRENT_UPLOADS = 8
+
+async def update_supabase_for_institution(supabase_client: Client, records: list[dict], institution_name: str):
     """
-    Atomically updates Supabase for a single institution.
-    1. Deletes all old records for that bank.
-    2. Inserts all new records from the dataframe.
+    Replaces a single institution's rates in Supabase with `records`, through the
+    same upsert-then-prune helper as run_all (see utils.replace_institution_rates).
     """
-    if not institution_name or df.empty:
-        print(f"--- FAILED (Upload): Invalid data for {institution_name}. Skipping upload.")
+    if not institution_name or not records:
+        logger.warning("--- FAILED (Upload): Invalid data for %s. Skipping upload.", institution_name)
         return
 
-    print(f"    - Starting atomic update for: '{institution_name}'")
+    logger.info("    - Starting upsert for: '%s'", institution_name)
     
     try:
-        # 1. Standardize and clean the DataFrame
-        records = clean_and_rename_df(df).to_dict('records')
-        
-        # 2. Delete all existing records for this bank
-        print(f"    - Deleting old records for '{institution_name}'...")
-        delete_response = await asyncio.to_thread(
-            supabase_client.from_("public-rates")
-            .delete()
-            .eq("bankName", institution_name)
-            .execute
-        )
-        if delete_response.data:
-            print(f"    - Deleted {len(delete_response.data)} old records.")
-        else:
-             print(f"    - No old records found for '{institution_name}'.")
-
-        # 3. Insert all new records
-        print(f"    - Inserting {len(records)} new records for '{institution_name}'...")
-        insert_response = await asyncio.to_thread(
-            supabase_client.from_("public-rates")
-            .insert(records)
-            .execute
-        )
-
-        if len(insert_response.data) == len(records):
-            print(f"    - SUCCESS (Upload): '{institution_name}' -> Atomically updated {len(records)} records.")
-        else:
-            print(f"--- WARNING (Upload): Mismatch for '{institution_name}'. Expected {len(records)}, inserted {len(insert_response.data)}.")
-            
+        records = await replace_institution_rates(supabase_client, institution_name, clean_records(records))
+        logger.info("    - SUCCESS (Upload): '%s' -> Upserted %d records.", institution_name, len(records))
     except Exception as e:
-        print(f"--- FAILED (Upload): Batch commit failed for '{institution_name}'. Error: {e}", file=sys.stderr)
+        logger.error("--- FAILED (Upload): Batch commit failed for '%s'. Error: %s", institution_name, e)
 
-# --- THIS FUNCTION IS UPDATED ---
-def clean_and_rename_df(df):
+async def upload_all(supabase_client: Client, records_by_institution: dict[str, list[dict]]):
     """
-    Standardizes the DataFrame before it's uploaded to Supabase.
+    Uploads every institution's records concurrently, so the total upload time
+    is roughly the slowest single upload instead of the sum of all of them.
     """
-    df_renamed = df.rename(columns={
-        'Bank Name': 'bankName',
-        'FD Type': 'fdType',
-        'Institution Type': 'institutionType', # <-- ADDED
-        'Term (Months)': 'termMonths',
-        'Payout Schedule': 'payoutSchedule',
-        'Interest Rate (p.a.)': 'interestRate',
-        'Annual Effective Rate': 'aer'
-    })
-    
-    # Ensure all required columns exist, add if missing
-    required_cols = ['bankName', 'fdType', 'institutionType', 'termMonths', 'payoutSchedule', 'interestRate', 'aer'] # <-- ADDED 'institutionType'
-    for col in required_cols:
-        if col not in df_renamed.columns:
-            df_renamed[col] = None
-            
-    # Select only the required columns and handle NaN/NaT
-    df_final = df_renamed[required_cols]
-    df_final = df_final.where(pd.notna(df_final), None)
-    return df_final.sort_values(by=['bankName', 'termMonths']).reset_index(drop=True)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
 
+    async def upload_one(name, records):
+        async with semaphore:
+            await update_supabase_for_institution(supabase_client, records, name)
+
+    await asyncio.gather(*(upload_one(name, records) for name, records in records_by_institution.items()))
+
+# Patterns shared by the scrapers' parsing helpers, compiled once at import
+_INT_RE = re.compile(r'(\d+)')
+_MONTHS_RE = re.compile(r'(\d+)\s*Month', re.IGNORECASE)
+_PCT_AER_RE = re.compile(r'([\d.]+)\s*%\s*(?:\(AER\s*([\d.]+)\s*%\))?', re.IGNORECASE)
+
+# XPath expression for an element's full text (including any <strong>/<span> inside
+# it, with whitespace collapsed), lowercased (XPath 1.0 has no lower-case())
+LOWER_TEXT = 'translate(normalize-space(.), "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")'
+
+def has_class(name):
+    """XPath predicate for an element whose class list includes `name`."""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+# Compiled once: row.xpath('./td') would re-parse the expression for every row
+ROW_CELLS = etree.XPath('./td')
+ROW_CELLS_AND_HEADERS = etree.XPath('./td | ./th')
+
+# Rate tables are a term cell followed by (rate, AER) column pairs, one pair per
+# payout schedule; a layout lists (rate column, AER column, payout schedule)
+MONTHLY_THEN_MATURITY = ((1, 2, 'Monthly'), (3, 4, 'At Maturity'))
+MATURITY_THEN_MONTHLY = ((1, 2, 'At Maturity'), (3, 4, 'Monthly'))
+
+def rate_records(rows, bank_name, fd_type, layout, cell_path='./td', clean=clean_rate,
+                 parse_term=parse_term_to_months, institution_type='Finance Company'):
+    """
+    Turns the rows of a rate table into records, one per payout schedule in `layout`
+    with a rate. Rows without exactly one cell per column, or whose first cell isn't
+    a term, are skipped.
+    """
+    records = []
+    width = 1 + 2 * len(layout)
+    row_cells = etree.XPath(cell_path)
+    for row in rows:
+        cells = [cell.text_content().strip() for cell in row_cells(row)]
+        if len(cells) != width or not (term_months := parse_term(cells[0])): continue
+        for rate_col, aer_col, payout_schedule in layout:
+            if rate := clean(cells[rate_col]):
+                records.append({'Bank Name': bank_name, 'FD Type': fd_type, 'Institution Type': institution_type, 'Term (Months)': term_months, 'Payout Schedule': payout_schedule, 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': clean(cells[aer_col])})
+    return records
+
+async def new_scraper_context(browser):
+    """Opens an isolated browser context that aborts image, stylesheet, font, media and tracker requests."""
+    context = await browser.new_context(viewport={'width': 800, 'height': 600})
+    await context.route('**/*', block_unused_resources)
+    return context
+
+# Pages fetched by fetch_root are kept here with their ETag / Last-Modified, so the
+# next run can revalidate them and get an empty 304 instead of the whole page again
+PAGE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'fd-scraper', 'pages')
+
+def _page_cache_path(url):
+    return os.path.join(PAGE_CACHE_DIR, hashlib.blake2b(url.encode(), digest_size=16).hexdigest())
+
+def _cached_validators(cache_path):
+    """Conditional-GET headers for a cached page, or {} if there is no usable copy."""
+    try:
+        with open(cache_path + '.json', 'rb') as f:
+            validators = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not os.path.exists(cache_path + '.html'):
+        return {}
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+def fetch_root(url, stop_after=None):
+    """
+    Downloads a page and returns its lxml root. The body is streamed into lxml's feed
+    parser, so parsing overlaps the download and the full body is never held in memory
+    next to the tree. Pages served with an ETag or Last-Modified are also written to
+    PAGE_CACHE_DIR and revalidated next time; on a 304 the cached copy is parsed instead.
+
+    With stop_after=(tag, id), reading stops as soon as that element has been parsed,
+    so the rest of the page (footers, scripts, inline SVGs) is neither downloaded nor
+    parsed. Only use it when nothing after that element is needed; such partial pages
+    aren't cached.
+    """
+    cache_path = _page_cache_path(url)
+    if stop_after is None:
+        parser = html.HTMLParser()
+    else:
+        stop_tag, stop_id = stop_after
+        parser = etree.HTMLPullParser(events=('end',), tag=stop_tag)
+        parser.set_element_class_lookup(html.HtmlElementClassLookup())
+    request = HTTP_CLIENT.build_request('GET', url, headers=_cached_validators(cache_path))
+    with closing(send_with_retries(request)) as response:
+        if response.status_code == 304:
+            return html.parse(cache_path + '.html').getroot()
+        response.raise_for_status()
+        validators = {'etag': response.headers.get('etag'), 'last_modified': response.headers.get('last-modified')}
+        if stop_after is not None or not any(validators.values()):
+            for chunk in response.iter_bytes():
+                parser.feed(chunk)
+                if stop_after is not None and any(element.get('id') == stop_id for _, element in parser.read_events()):
+                    break
+            return parser.close()
+        os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+        # Written under a temporary name so a failed download never replaces a good copy
+        with open(cache_path + '.html.tmp', 'wb') as body:
+            for chunk in response.iter_bytes():
+                parser.feed(chunk)
+                body.write(chunk)
+    os.replace(cache_path + '.html.tmp', cache_path + '.html')
+    with open(cache_path + '.json', 'wb') as f:
+        f.write(orjson.dumps(validators))
+    return parser.close()
+
+async def fetch_static_root(url, required_xpath):
+    """
+    Fetches a page without a browser and returns its lxml root if the server-rendered HTML
+    already matches `required_xpath`; returns None so the caller can fall back to Playwright.
+    """
+    try:
+        root = await asyncio.to_thread(fetch_root, url)
+    except Exception:  # any fetch or parse failure just means using the browser instead
+        return None
+    return root if root.xpath(required_xpath) else None
+
+# One pooled client for every sync scraper, so repeat visits to a host reuse the
+# kept-alive connection instead of paying for a new TCP + TLS handshake each time.
+# httpx.Client is thread-safe; the pool is sized for all sync scrapers at once.
+# The transport retries failed connects itself; responses in RETRY_STATUSES are
+# retried by send_with_retries after 0.5s, 1s, 2s, ... (the same policy as BaseScraper)
+
+HTTP_CLIENT = httpx.Client(
+    headers={'User-Agent': 'Mozilla/5.0'},
+    timeout=20,
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        retries=HTTP_RETRIES,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    ),
+)
+
+def send_with_retries(request):
+    """
+    Sends a request on HTTP_CLIENT as a stream, retrying throttled and server-error
+    responses with exponential backoff so one transient blip doesn't cost the scraper
+    its whole run. The last attempt's response is returned whatever its status.
+    """
+    for attempt in range(HTTP_RETRIES):
+        response = HTTP_CLIENT.send(request, stream=True)
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        response.close()
+        time.sleep(RETRY_BACKOFF * 2 ** attempt)
+    return HTTP_CLIENT.send(request, stream=True)
 
 # ==============================================================================
 # --- BANK SCRAPERS (9 TOTAL) ---
@@ -88,96 +213,93 @@ def clean_and_rename_df(df):
 def scrape_cargills_bank_fd_rates():
     """Scrapes FD rates from the Cargills Bank website."""
     
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            term_text = term_text.lower()
-            if 'year' in term_text:
-                match = re.search(r'(\d+)', term_text)
-                return int(match.group(1)) * 12 if match else None
-            elif 'month' in term_text:
-                match = re.search(r'(\d+)', term_text)
-                return int(match.group(1)) if match else None
-        return None
-        
     url = 'https://www.cargillsbank.com/deposit-interest-rates'
-    print(f"--- Starting: Cargills Bank ---")
+    logger.info("--- Starting: Cargills Bank ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        all_rates_data = []
+        root = fetch_root(url)
+        # (FD Type, Term, Payout Schedule, Rate, AER); the bank name and institution
+        # type are the same on every row, so they're only attached at the end
+        rows = []
         
-        standard_header = soup.find('p', string=re.compile(r'Fixed Deposits \(LKR\)', re.IGNORECASE))
-        if standard_header and (standard_table := standard_header.find_next_sibling('table')):
-            for row in standard_table.select('tbody > tr')[1:]:
-                cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
+        standard_tables = root.xpath(f'//p[contains({LOWER_TEXT}, "fixed deposits (lkr)")]/following-sibling::table[1]')
+        if standard_tables:
+            for row in islice(standard_tables[0].xpath('.//tbody/tr'), 1, None):
+                cells = [cell.text_content().strip() for cell in ROW_CELLS(row)]
                 if len(cells) != 6: continue
                 term_months = parse_term_to_months(cells[0])
                 if not term_months: continue
-                if rate := clean_rate(cells[1]): all_rates_data.append({'Bank Name': 'Cargills Bank', 'FD Type': 'Standard', 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': clean_rate(cells[2])})
-                if rate := clean_rate(cells[3]): all_rates_data.append({'Bank Name': 'Cargills Bank', 'FD Type': 'Standard', 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': clean_rate(cells[4])})
-                if rate := clean_rate(cells[5]): all_rates_data.append({'Bank Name': 'Cargills Bank', 'FD Type': 'Standard', 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'Annually', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': None})
-
-        senior_header = soup.find('p', string=re.compile(r'Senior Citizen Fixed Deposits', re.IGNORECASE))
-        if senior_header and (senior_table := senior_header.find_next_sibling('table')):
-            for row in senior_table.select('tbody > tr')[1:]:
-                cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
+                rates = list(map(clean_rate, cells))
+                for rate_col, aer_col, schedule in ((1, 2, 'At Maturity'), (3, 4, 'Monthly'), (5, None, 'Annually')):
+                    if rate := rates[rate_col]: rows.append(('Standard', term_months, schedule, rate, rates[aer_col] if aer_col else None))
+
+        senior_tables = root.xpath(f'//p[contains({LOWER_TEXT}, "senior citizen fixed deposits")]/following-sibling::table[1]')
+        if senior_tables:
+            for row in islice(senior_tables[0].xpath('.//tbody/tr'), 1, None):
+                cells = [cell.text_content().strip() for cell in ROW_CELLS(row)]
                 if len(cells) != 3: continue
                 term_months = parse_term_to_months(cells[0])
                 if not term_months: continue
-                if rate := clean_rate(cells[1]): all_rates_data.append({'Bank Name': 'Cargills Bank', 'FD Type': 'Senior Citizen', 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': None})
-                if rate := clean_rate(cells[2]): all_rates_data.append({'Bank Name': 'Cargills Bank', 'FD Type': 'Senior Citizen', 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': None})
+                rates = list(map(clean_rate, cells))
+                for rate_col, schedule in ((1, 'At Maturity'), (2, 'Monthly')):
+                    if rate := rates[rate_col]: rows.append(('Senior Citizen', term_months, schedule, rate, None))
 
-        if not all_rates_data:
-            print("--- FAILED: Cargills Bank - No data extracted.")
+        if not rows:
+            logger.warning("--- FAILED: Cargills Bank - No data extracted.")
             return None
+
+        all_rates_data = [
+            {'Bank Name': 'Cargills Bank', 'FD Type': fd_type, 'Institution Type': 'Bank', 'Term (Months)': term, 'Payout Schedule': schedule, 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': aer}
+            for fd_type, term, schedule, rate, aer in rows
+        ]
         
-        print(f"--- SUCCESS: Cargills Bank extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: Cargills Bank extracted %d records.", len(all_rates_data))
+        return all_rates_data
 
     except Exception as e:
-        print(f"--- FAILED: Cargills Bank scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Cargills Bank scraper threw an error. --- \nError: %s", e)
         return None
 
-async def scrape_commercial_bank_fd_rates():
-    """Scrapes Commercial Bank's Fixed Deposit rates using Playwright."""
+async def scrape_commercial_bank_fd_rates(browser):
+    """Scrapes Commercial Bank's Fixed Deposit rates, using Playwright only if the page needs it."""
     url = 'https://www.combank.lk/rates-tariff'
-    print("--- Starting: Commercial Bank ---")
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            fd_dropdown_locator = page.locator('a.expand-link:has-text("Fixed Deposits")')
-            await fd_dropdown_locator.wait_for(state="visible", timeout=20000)
-            await fd_dropdown_locator.click()
-            table_selector = 'div.expand-block:has(a:has-text("Fixed Deposits")) table.with-radius'
-            await page.wait_for_selector(table_selector, state='visible', timeout=15000)
-            html_content = await page.content()
-            await browser.close()
-    except Exception as e:
-        print(f"--- FAILED: Commercial Bank scraper threw an error during browser automation. --- \nError: {e}", file=sys.stderr)
-        return None
+    logger.info("--- Starting: Commercial Bank ---")
+    table_xpath = (
+        f'(//a[{has_class("expand-link")} and contains(normalize-space(.), "Fixed Deposits")])[1]'
+        f'/ancestor::div[{has_class("expand-block")}][1]//table[{has_class("with-radius")}]'
+    )
+    # The dropdown normally just reveals a table that is already in the served HTML,
+    # so only start a browser page when a plain fetch doesn't have its rate rows
+    if (root := await fetch_static_root(url, f'{table_xpath}//tbody/tr[td]')) is None:
+        try:
+            context = await new_scraper_context(browser)
+            try:
+                page = await context.new_page()
+                await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+                fd_dropdown_locator = page.locator('a.expand-link:has-text("Fixed Deposits")')
+                await fd_dropdown_locator.wait_for(state="visible", timeout=20000)
+                await fd_dropdown_locator.click()
+                table_selector = 'div.expand-block:has(a:has-text("Fixed Deposits")) table.with-radius'
+                await page.wait_for_selector(table_selector, state='visible', timeout=15000)
+                html_content = await page.content()
+            finally:
+                await context.close()
+        except Exception as e:
+            logger.error("--- FAILED: Commercial Bank scraper threw an error during browser automation. --- \nError: %s", e)
+            return None
+        root = html.fromstring(html_content)
 
-    soup = BeautifulSoup(html_content, 'lxml')
-    fd_link = next((link for link in soup.find_all('a', class_='expand-link') if "Fixed Deposits" in link.get_text(separator=" ", strip=True)), None)
-    if not (fd_link and (fd_parent_block := fd_link.find_parent('div', class_='expand-block')) and (table_element := fd_parent_block.find('table', class_='with-radius'))):
-        print("--- FAILED: Commercial Bank - Could not parse the rates table from HTML.")
+    tables = root.xpath(table_xpath)
+    if not tables:
+        logger.warning("--- FAILED: Commercial Bank - Could not parse the rates table from HTML.")
         return None
 
     data_rows = []
-    for row in table_element.select('tbody > tr'):
-        cells = row.find_all('td')
+    for row in tables[0].xpath('.//tbody/tr'):
+        cells = ROW_CELLS(row)
         if len(cells) != 4: continue
         try:
-            description_raw = cells[0].get_text(separator=" ", strip=True)
-            term_match = re.search(r'(\d+)\s*Months?', description_raw, re.IGNORECASE)
+            description_raw = ' '.join(cells[0].text_content().split())
+            term_match = _MONTHS_RE.search(description_raw)
             payout_schedule = 'Monthly' if 'monthly' in description_raw.lower() else 'Annually' if 'annually' in description_raw.lower() else 'At Maturity'
             data_rows.append({
                 'Bank Name': 'Commercial Bank', 
@@ -185,59 +307,49 @@ async def scrape_commercial_bank_fd_rates():
                 'Institution Type': 'Bank',
                 'Term (Months)': int(term_match.group(1)) if term_match else None,
                 'Payout Schedule': payout_schedule,
-                'Interest Rate (p.a.)': float(cells[1].get_text(strip=True)),
-                'Annual Effective Rate': float(cells[2].get_text(strip=True)),
+                'Interest Rate (p.a.)': float(cells[1].text_content().strip()),
+                'Annual Effective Rate': float(cells[2].text_content().strip()),
             })
         except (ValueError, IndexError): continue
 
     if not data_rows:
-        print("--- FAILED: Commercial Bank - No data rows extracted.")
+        logger.warning("--- FAILED: Commercial Bank - No data rows extracted.")
         return None
         
-    print(f"--- SUCCESS: Commercial Bank extracted {len(data_rows)} records.")
-    return pd.DataFrame(data_rows)
+    logger.info("--- SUCCESS: Commercial Bank extracted %d records.", len(data_rows))
+    return data_rows
 
 def scrape_dfcc_fd_rates_final():
     """Scrapes FD rates from the DFCC Bank website."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '']:
-            try: return float(rate_text.replace('%', '').strip())
-            except ValueError: return None
-        return None
-
-    def parse_term_to_months(term_text):
-        match = re.search(r'(\d+)\s*(Month|Year)s?', term_text, re.IGNORECASE)
-        if match:
-            value, unit = int(match.group(1)), match.group(2).lower()
-            return value if unit == 'month' else value * 12
-        return None
-
-    def process_dfcc_table(table):
+    def process_dfcc_table(table, fd_type):
         data = []
-        all_rows_in_body = table.select('tbody > tr')
+        all_rows_in_body = table.xpath('.//tbody/tr')
         if len(all_rows_in_body) < 2: return data
-        
-        headers = [th.get_text(strip=True) for th in all_rows_in_body[0].find_all('th')]
+
+        headers = [th.text_content().strip() for th in all_rows_in_body[0].xpath('./th')]
+        # The header row is the same for every rate/AER row pair, so read its terms once
+        header_months = [parse_term_to_months(header) for header in headers]
         data_rows = all_rows_in_body[1:]
 
         for i in range(0, len(data_rows), 2):
             if i + 1 >= len(data_rows): continue
-            rate_row_cells = data_rows[i].find_all('td')
-            aer_row_cells = data_rows[i+1].find_all('td')
+            rate_row_cells = ROW_CELLS(data_rows[i])
+            aer_row_cells = ROW_CELLS(data_rows[i+1])
             if not rate_row_cells or not aer_row_cells: continue
 
-            payout_schedule = 'At Maturity' if 'Nominal' in rate_row_cells[0].get_text(strip=True) else rate_row_cells[0].get_text(strip=True)
+            row_label = rate_row_cells[0].text_content().strip()
+            payout_schedule = 'At Maturity' if 'Nominal' in row_label else row_label
 
             for col_index in range(1, len(headers)):
-                term_months = parse_term_to_months(headers[col_index])
+                term_months = header_months[col_index]
                 if not term_months: continue
                 if col_index < len(rate_row_cells) and col_index < len(aer_row_cells):
-                    rate = clean_rate(rate_row_cells[col_index].get_text())
-                    aer = clean_rate(aer_row_cells[col_index].get_text())
+                    rate = clean_rate(rate_row_cells[col_index].text_content())
+                    aer = clean_rate(aer_row_cells[col_index].text_content())
                     if rate is not None:
                         data.append({
                             'Bank Name': 'DFCC Bank', 
-                            'FD Type': 'Standard',
+                            'FD Type': fd_type,
                             'Institution Type': 'Bank',
                             'Term (Months)': term_months, 
                             'Payout Schedule': payout_schedule,
@@ -247,52 +359,43 @@ def scrape_dfcc_fd_rates_final():
         return data
 
     url = 'https://www.dfcc.lk/interest-rates/fd-rates/'
-    print(f"--- Starting: DFCC Bank ---")
+    logger.info("--- Starting: DFCC Bank ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        main_content = soup.find('div', id='ratest-tab-04')
+        root = fetch_root(url)
+        main_content = root.xpath('//div[@id="ratest-tab-04"]')
         if not main_content:
-            print("--- FAILED: DFCC Bank - Could not find main content container.")
+            logger.warning("--- FAILED: DFCC Bank - Could not find main content container.")
             return None
 
         all_rates = []
-        for header in main_content.find_all('h3'):
-            if "FD Rates" in header.get_text(strip=True):
-                if table := header.find_next('table'):
-                    all_rates.extend(process_dfcc_table(table))
+        # Each "... FD Rates" heading introduces a separate product, so its table's rows
+        # are typed by the heading ("Senior Citizen FD Rates" -> 'Senior Citizen');
+        # sharing one type would give their rows clashing keys
+        for header in main_content[0].xpath('.//h3[contains(., "FD Rates")]'):
+            fd_type = ' '.join(header.text_content().replace('FD Rates', ' ').split()).strip(' -–:') or 'Standard'
+            for table in header.xpath('following::table[1]'):
+                all_rates.extend(process_dfcc_table(table, fd_type))
         
         if not all_rates:
-            print("--- FAILED: DFCC Bank - No data extracted.")
+            logger.warning("--- FAILED: DFCC Bank - No data extracted.")
             return None
             
-        print(f"--- SUCCESS: DFCC Bank extracted {len(all_rates)} records.")
-        return pd.DataFrame(all_rates)
+        logger.info("--- SUCCESS: DFCC Bank extracted %d records.", len(all_rates))
+        return all_rates
 
     except Exception as e:
-        print(f"--- FAILED: DFCC Bank scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: DFCC Bank scraper threw an error. --- \nError: %s", e)
         return None
 
-async def scrape_hnb_fd_rates_final():
+async def scrape_hnb_fd_rates_final(browser):
     """Scrapes HNB Fixed Deposit rates using Playwright."""
     url = 'https://www.hnb.lk/interest-rates'
-    print("--- Starting: Hatton National Bank (HNB) ---")
+    logger.info("--- Starting: Hatton National Bank (HNB) ---")
     
-    def clean_rate(text):
-        if text and text.strip() != '-':
-            try: return float(text.replace('%', '').strip())
-            except (ValueError, TypeError): return None
-        return None
-
-    def parse_term(text):
-        match = re.search(r'(\d+)\s*Month', text, re.IGNORECASE)
-        return int(match.group(1)) if match else None
-
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        context = await new_scraper_context(browser)
+        try:
+            page = await context.new_page()
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
             sidebar = page.locator('nav.grid')
             fd_link_locator = sidebar.get_by_text("Fixed Deposits", exact=True)
@@ -300,64 +403,54 @@ async def scrape_hnb_fd_rates_final():
             await fd_link_locator.click()
             await page.wait_for_selector('h2:has-text("Fixed Deposits Interest Rates")', state='visible', timeout=15000)
             html_content = await page.content()
-            await browser.close()
+        finally:
+            await context.close()
     except Exception as e:
-        print(f"--- FAILED: HNB scraper threw an error during browser automation. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: HNB scraper threw an error during browser automation. --- \nError: %s", e)
         return None
 
-    soup = BeautifulSoup(html_content, 'lxml')
+    root = html.fromstring(html_content)
     all_rates_data = []
-    content_area = soup.find('div', class_=lambda c: 'w-3/4' in (c or ''))
+    content_area = root.xpath('(//div[contains(@class, "w-3/4")])[1]')
     if not content_area:
-        print("--- FAILED: HNB - Could not find main content area.")
+        logger.warning("--- FAILED: HNB - Could not find main content area.")
         return None
 
-    std_header = content_area.find('h2', string='Fixed Deposits Interest Rates')
-    if std_header and (std_table := std_header.find_next_sibling('table')):
-        headers = [th.get_text(strip=True) for th in std_table.find_all('th')]
-        for row in std_table.select('tbody > tr'):
-            cells = row.find_all('td')
-            if not cells or not (term_months := parse_term(cells[0].get_text(strip=True))): continue
-            aer = clean_rate(cells[-1].get_text())
+    std_tables = content_area[0].xpath('(.//h2[. = "Fixed Deposits Interest Rates"])[1]/following-sibling::table[1]')
+    if std_tables:
+        std_table = std_tables[0]
+        headers = [th.text_content().strip() for th in std_table.xpath('.//th')]
+        for row in std_table.xpath('.//tbody/tr'):
+            cells = ROW_CELLS(row)
+            if not cells or not (term_months := parse_term_to_months(cells[0].text_content().strip())): continue
+            aer = clean_rate(cells[-1].text_content())
             for i, schedule in enumerate(headers[1:-1]):
-                if rate := clean_rate(cells[i + 1].get_text()):
+                if rate := clean_rate(cells[i + 1].text_content()):
                     all_rates_data.append({'Bank Name': 'Hatton National Bank (HNB)', 'FD Type': 'Standard', 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': schedule.title(), 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': aer})
     
     if not all_rates_data:
-        print("--- FAILED: HNB - No data extracted.")
+        logger.warning("--- FAILED: HNB - No data extracted.")
         return None
         
-    print(f"--- SUCCESS: HNB extracted {len(all_rates_data)} records.")
-    return pd.DataFrame(all_rates_data)
+    logger.info("--- SUCCESS: HNB extracted %d records.", len(all_rates_data))
+    return all_rates_data
 
 def scrape_nsb_fd_rates():
     """Scrapes NSB's Rupee Term Deposit rates."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip():
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-
-    def parse_term_from_details(details_text):
-        match = re.search(r'(\d+)\s+Months?', details_text, re.IGNORECASE)
-        return int(match.group(1)) if match else None
-
     url = 'https://www.nsb.lk/rates-tarriffs/rupee-deposit-rates/'
-    print(f"--- Starting: National Savings Bank (NSB) ---")
+    logger.info("--- Starting: National Savings Bank (NSB) ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        header = soup.find('a', string=re.compile(r'Term Deposits'))
-        if not header or not (card_div := header.find_parent('div', class_='card')) or not (table := card_div.find('table')):
-            print("--- FAILED: NSB - Could not find the rates table.")
+        root = fetch_root(url)
+        tables = root.xpath(f'(//a[contains(normalize-space(.), "Term Deposits")])[1]/ancestor::div[{has_class("card")}][1]//table')
+        if not tables:
+            logger.warning("--- FAILED: NSB - Could not find the rates table.")
             return None
 
         all_rates = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
+        for row in tables[0].xpath('.//tbody/tr'):
+            cells = [cell.text_content().strip() for cell in ROW_CELLS(row)]
             if len(cells) != 6 or 'Endowment' in cells[0]: continue
-            if not (term_months := parse_term_from_details(cells[0])): continue
+            if not (term_months := parse_term_to_months(cells[0])): continue
             if interest_rate := clean_rate(cells[2]):
                 effective_rate = clean_rate(cells[5])
                 all_rates.append({
@@ -371,53 +464,48 @@ def scrape_nsb_fd_rates():
                 })
         
         if not all_rates:
-            print("--- FAILED: NSB - No data was extracted.")
+            logger.warning("--- FAILED: NSB - No data was extracted.")
             return None
             
-        print(f"--- SUCCESS: NSB extracted {len(all_rates)} records.")
-        return pd.DataFrame(all_rates)
+        logger.info("--- SUCCESS: NSB extracted %d records.", len(all_rates))
+        return all_rates
 
     except Exception as e:
-        print(f"--- FAILED: NSB scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: NSB scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_ntb_fd_rates_final():
     """Scrapes Fixed Deposit rates for LKR from the NTB website."""
     def parse_rate_and_aer(cell_content):
-        text = cell_content.decode_contents(formatter="html").replace('<br/>', ' ').replace('<br>', ' ').strip()
-        numbers = re.findall(r'[\d.]+', text)
+        # The rate and AER sit in separate text nodes split by a <br>
+        numbers = _NUM_RE.findall(' '.join(cell_content.itertext()))
         if not numbers: return None, None
         rate = float(numbers[0])
         aer = float(numbers[1]) if len(numbers) > 1 else rate
         return rate, aer
 
-    def parse_term_to_months(header_text):
-        match = re.search(r'(\d+)\s*month', header_text, re.IGNORECASE)
-        return int(match.group(1)) if match else None
-
     url = 'https://www.nationstrust.com/deposit-rates'
-    print(f"--- Starting: Nations Trust Bank (NTB) ---")
+    logger.info("--- Starting: Nations Trust Bank (NTB) ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        fd_header = soup.find('div', class_='section_heading', string='Fixed Deposit Rates')
-        if not fd_header or not (table := fd_header.find_next('table')):
-            print("--- FAILED: NTB - Could not find the rates table.")
+        root = fetch_root(url)
+        tables = root.xpath(f'(//div[{has_class("section_heading")} and . = "Fixed Deposit Rates"])[1]/following::table[1]')
+        if not tables:
+            logger.warning("--- FAILED: NTB - Could not find the rates table.")
             return None
 
+        table = tables[0]
         all_rates_data = []
-        headers = table.find('thead').find_all('th')
-        term_months = [parse_term_to_months(h.get_text(strip=True)) for h in headers[2:]]
+        headers = table.xpath('(.//thead)[1]//th')
+        term_months = [parse_term_to_months(h.text_content().strip()) for h in headers[2:]]
         current_currency = ''
-        
-        for row in table.select('tbody > tr'):
-            cells = row.find_all('td')
+
+        for row in table.xpath('.//tbody/tr'):
+            cells = ROW_CELLS(row)
             if not cells or len(cells) < len(headers): continue
-            if currency_in_cell := cells[0].get_text(strip=True): current_currency = currency_in_cell
+            if currency_in_cell := cells[0].text_content().strip(): current_currency = currency_in_cell
             if current_currency != 'LKR': continue
-            
-            deposit_type_text = cells[1].get_text(strip=True)
+
+            deposit_type_text = cells[1].text_content().strip()
             if 'Maturity' in deposit_type_text: payout_schedule = 'At Maturity'
             elif 'Monthly' in deposit_type_text: payout_schedule = 'Monthly'
             elif 'Annually' in deposit_type_text: payout_schedule = 'Annually'
@@ -429,40 +517,28 @@ def scrape_ntb_fd_rates_final():
                     all_rates_data.append({'Bank Name': 'Nations Trust Bank', 'FD Type': 'Standard', 'Institution Type': 'Bank', 'Term (Months)': term_months[i], 'Payout Schedule': payout_schedule, 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': aer})
 
         if not all_rates_data:
-            print("--- FAILED: NTB - No LKR rate data was extracted.")
+            logger.warning("--- FAILED: NTB - No LKR rate data was extracted.")
             return None
 
-        print(f"--- SUCCESS: NTB extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: NTB extracted %d records.", len(all_rates_data))
+        return all_rates_data
 
     except Exception as e:
-        print(f"--- FAILED: NTB scraper threw an error. --- \nError: {e}", file=sys.stderr)
-        return None
-
-async def scrape_pan_asia_fd_rates_final():
-    """Scrapes Pan Asia Bank rates using Playwright."""
-    def clean_rate(text):
-        if isinstance(text, str) and text.strip():
-            match = re.search(r'([\d.]+)', text)
-            return float(match.group(1)) if match else None
-        return None
-
-    def parse_term_to_months(text):
-        if isinstance(text, str):
-            match = re.search(r'(\d+)\s*Month', text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
+        logger.error("--- FAILED: NTB scraper threw an error. --- \nError: %s", e)
         return None
 
+async def scrape_pan_asia_fd_rates_final(browser):
+    """Scrapes Pan Asia Bank rates, using Playwright only if the page needs it."""
     def process_pan_asia_table(table, fd_type):
         records = []
-        if not (thead := table.find('thead')) or not (header_row := thead.find('tr')): return []
-        terms = [td.get_text(strip=True) for td in header_row.find_all(['th', 'td'])]
-        body_rows = table.select('tbody > tr')
+        if not (header_rows := table.xpath('(.//thead)[1]//tr')): return []
+        terms = [td.text_content().strip() for td in header_rows[0].xpath('./th | ./td')]
+        body_rows = table.xpath('.//tbody/tr')
         if len(body_rows) < 3: return []
-        
-        payout_schedules = [td.get_text(strip=True) for td in body_rows[0].find_all(['th', 'td'])]
-        interest_rates = [td.get_text(strip=True) for td in body_rows[1].find_all(['th', 'td'])]
-        aer_rates = [td.get_text(strip=True) for td in body_rows[2].find_all(['th', 'td'])]
+
+        payout_schedules = [td.text_content().strip() for td in body_rows[0].xpath('./th | ./td')]
+        interest_rates = [td.text_content().strip() for td in body_rows[1].xpath('./th | ./td')]
+        aer_rates = [td.text_content().strip() for td in body_rows[2].xpath('./th | ./td')]
 
         for i in range(1, len(terms)):
             if not (term_months := parse_term_to_months(terms[i])): continue
@@ -471,637 +547,412 @@ async def scrape_pan_asia_fd_rates_final():
         return records
 
     url = 'https://www.pabcbank.com/personal-banking/savings-investments/fixed-deposits/general-fixed-deposits/'
-    print(f"--- Starting: Pan Asia Bank ---")
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            await page.wait_for_selector('h2#cRate', state='visible', timeout=20000)
-            html_content = await page.content()
-            await browser.close()
-    except Exception as e:
-        print(f"--- FAILED: Pan Asia Bank scraper threw an error during browser automation. --- \nError: {e}", file=sys.stderr)
-        return None
+    logger.info("--- Starting: Pan Asia Bank ---")
+    # The rates are server-rendered, so a plain fetch normally has them already; the
+    # heading alone isn't enough, since it is there even when scripts fill the tables
+    rate_rows_xpath = f'(//h2[@id="cRate"])[1]/../..//figure[{has_class("wp-block-table")}]//table//tbody/tr[td]'
+    if (root := await fetch_static_root(url, rate_rows_xpath)) is None:
+        try:
+            context = await new_scraper_context(browser)
+            try:
+                page = await context.new_page()
+                await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+                await page.wait_for_selector('h2#cRate', state='visible', timeout=20000)
+                html_content = await page.content()
+            finally:
+                await context.close()
+        except Exception as e:
+            logger.error("--- FAILED: Pan Asia Bank scraper threw an error during browser automation. --- \nError: %s", e)
+            return None
+        root = html.fromstring(html_content)
 
-    soup = BeautifulSoup(html_content, 'lxml')
-    content_anchor = soup.find('h2', id='cRate')
-    if not content_anchor or not (content_section := content_anchor.parent.parent):
-        print("--- FAILED: Pan Asia Bank - Could not find content anchor.")
+    content_sections = root.xpath('(//h2[@id="cRate"])[1]/../..')
+    if not content_sections:
+        logger.warning("--- FAILED: Pan Asia Bank - Could not find content anchor.")
         return None
-        
+
     all_rates = []
-    for table_fig in content_section.find_all('figure', class_='wp-block-table'):
-        if table := table_fig.find('table'):
-            all_rates.extend(process_pan_asia_table(table, 'Standard')) 
+    for table in content_sections[0].xpath(f'.//figure[{has_class("wp-block-table")}]/descendant::table[1]'):
+        all_rates.extend(process_pan_asia_table(table, 'Standard'))
 
     if not all_rates:
-        print("--- FAILED: Pan Asia Bank - No rate data was extracted.")
+        logger.warning("--- FAILED: Pan Asia Bank - No rate data was extracted.")
         return None
         
-    print(f"--- SUCCESS: Pan Asia Bank extracted {len(all_rates)} records.")
-    return pd.DataFrame(all_rates)
+    logger.info("--- SUCCESS: Pan Asia Bank extracted %d records.", len(all_rates))
+    return all_rates
 
 def scrape_peoples_bank_fd_rates():
     """Scrapes all relevant LKR FD rates from the People's Bank website."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '']:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*Month', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
-
     def process_standard_table(table, fd_type):
         records = []
-        for row in table.select('tbody > tr'):
-            cells = row.find_all('td')
-            if len(cells) < 3 or not (term_months := parse_term_to_months(cells[0].get_text(strip=True))): continue
-            if maturity_rate := clean_rate(cells[1].get_text()):
+        for row in table.xpath('.//tbody/tr'):
+            cells = ROW_CELLS(row)
+            if len(cells) < 3 or not (term_months := parse_term_to_months(cells[0].text_content().strip())): continue
+            if maturity_rate := clean_rate(cells[1].text_content()):
                 records.append({'Bank Name': "People's Bank", 'FD Type': fd_type, 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': None})
-            if monthly_rate := clean_rate(cells[2].get_text()):
+            if monthly_rate := clean_rate(cells[2].text_content()):
                 records.append({'Bank Name': "People's Bank", 'FD Type': fd_type, 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': None})
         return records
 
     url = 'https://www.peoplesbank.lk/interest-rates/'
-    print(f"--- Starting: People's Bank ---")
+    logger.info("--- Starting: People's Bank ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        root = fetch_root(url)
         all_rates_data = []
 
-        main_fd_header = soup.find('h4', string=re.compile(r'Fixed deposits \(Minimum deposit'))
-        if main_fd_header and (main_fd_table := main_fd_header.find_next('table')):
-            all_rates_data.extend(process_standard_table(main_fd_table, 'Standard'))
+        main_fd_tables = root.xpath('(//h4[contains(normalize-space(.), "Fixed deposits (Minimum deposit")])[1]/following::table[1]')
+        if main_fd_tables:
+            all_rates_data.extend(process_standard_table(main_fd_tables[0], 'Standard'))
 
         if not all_rates_data:
-            print("--- FAILED: People's Bank - No data was extracted.")
+            logger.warning("--- FAILED: People's Bank - No data was extracted.")
             return None
 
-        print(f"--- SUCCESS: People's Bank extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: People's Bank extracted %d records.", len(all_rates_data))
+        return all_rates_data
 
     except Exception as e:
-        print(f"--- FAILED: People's Bank scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: People's Bank scraper threw an error. --- \nError: %s", e)
         return None
 
-async def scrape_sampath_fd_rates_final_final():
+async def scrape_sampath_fd_rates_final_final(browser):
     """Scrapes Sampath Bank FD rates using Playwright."""
     def extract_rate_and_aer(text):
         if not isinstance(text, str) or text.strip() in ['-', '']: return None, None
-        match = re.search(r'([\d.]+)\s*%\s*(?:\(AER\s*([\d.]+)\s*%\))?', text, re.IGNORECASE)
+        match = _PCT_AER_RE.search(text)
         if match:
             main_rate = float(match.group(1)) if match.group(1) else None
             aer_rate = float(match.group(2)) if match.group(2) else main_rate
             return main_rate, aer_rate
         return None, None
 
-    def parse_term_months(period_text):
-        if 'month' in period_text.lower():
-            match = re.search(r'(\d+)', period_text)
-            return int(match.group(1)) if match else None
-        return None
-
     url = 'https://www.sampath.lk/personal-banking/term-deposit-accounts/regular-deposits/Fixed-Deposits?category=personal_banking'
-    print("--- Starting: Sampath Bank ---")
+    logger.info("--- Starting: Sampath Bank ---")
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        context = await new_scraper_context(browser)
+        try:
+            page = await context.new_page()
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
             rates_button_locator = page.locator('div.type-info-block-icon-outer:has(p:has-text("Rates"))')
-            await rates_button_locator.scroll_into_view_if_needed()
-            await page.wait_for_timeout(500)
+            # click() already scrolls the button into view and waits until it is
+            # visible and stable, so no fixed settle delay is needed first
             await rates_button_locator.click()
             await page.wait_for_selector('p:has-text("Normal Fixed Deposit")', state='visible', timeout=15000)
             html_content = await page.content()
-            await browser.close()
+        finally:
+            await context.close()
     except Exception as e:
-        print(f"--- FAILED: Sampath Bank scraper threw an error during browser automation. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Sampath Bank scraper threw an error during browser automation. --- \nError: %s", e)
         return None
 
-    soup = BeautifulSoup(html_content, 'lxml')
+    root = html.fromstring(html_content)
     all_rates_data = []
-    fd_header = soup.find('p', string=re.compile(r'Normal Fixed Deposit', re.IGNORECASE))
-    if not fd_header or not (table_container := fd_header.find_parent('div', class_='rates-info-heading')) or not (fd_table := table_container.find_next_sibling('table')):
-        print("--- FAILED: Sampath Bank - Could not parse the rates table.")
-        return None
-
-    for row in fd_table.select('tbody > tr'):
-        cells = row.find_all('td')
-        if len(cells) < 4 or not (term_months := parse_term_months(cells[0].get_text(strip=True))): continue
-        maturity_rate, maturity_aer = extract_rate_and_aer(cells[1].get_text(strip=True))
-        monthly_rate, monthly_aer = extract_rate_and_aer(cells[2].get_text(strip=True))
-        annually_rate, annually_aer = extract_rate_and_aer(cells[3].get_text(strip=True))
+    fd_tables = root.xpath(
+        f'(//p[contains({LOWER_TEXT}, "normal fixed deposit")])[1]'
+        f'/ancestor::div[{has_class("rates-info-heading")}][1]/following-sibling::table[1]'
+    )
+    if not fd_tables:
+        logger.warning("--- FAILED: Sampath Bank - Could not parse the rates table.")
+        return None
+
+    for row in fd_tables[0].xpath('.//tbody/tr'):
+        cells = ROW_CELLS(row)
+        if len(cells) < 4 or not (term_months := parse_term_to_months(cells[0].text_content().strip())): continue
+        maturity_rate, maturity_aer = extract_rate_and_aer(cells[1].text_content().strip())
+        monthly_rate, monthly_aer = extract_rate_and_aer(cells[2].text_content().strip())
+        annually_rate, annually_aer = extract_rate_and_aer(cells[3].text_content().strip())
         if maturity_rate: all_rates_data.append({'Bank Name': 'Sampath Bank', 'FD Type': 'Normal', 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': maturity_aer})
         if monthly_rate: all_rates_data.append({'Bank Name': 'Sampath Bank', 'FD Type': 'Normal', 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': monthly_aer})
         if annually_rate: all_rates_data.append({'Bank Name': 'Sampath Bank', 'FD Type': 'Normal', 'Institution Type': 'Bank', 'Term (Months)': term_months, 'Payout Schedule': 'Annually', 'Interest Rate (p.a.)': annually_rate, 'Annual Effective Rate': annually_aer})
 
     if not all_rates_data:
-        print("--- FAILED: Sampath Bank - No data was extracted from table.")
+        logger.warning("--- FAILED: Sampath Bank - No data was extracted from table.")
         return None
     
-    print(f"--- SUCCESS: Sampath Bank extracted {len(all_rates_data)} records.")
-    return pd.DataFrame(all_rates_data)
+    logger.info("--- SUCCESS: Sampath Bank extracted %d records.", len(all_rates_data))
+    return all_rates_data
 
 # ==============================================================================
 # --- FINANCE COMPANY SCRAPERS (17 TOTAL) ---
 # ==============================================================================
 def scrape_alliance_finance_fd_rates():
     """Scrapes Alliance Finance PLC's Fixed Deposit rates."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*Month', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     url = 'https://www.alliancefinance.lk/investments/fixed-deposits/'
-    print(f"--- Starting: Alliance Finance ---")
+    logger.info("--- Starting: Alliance Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        table = soup.find('table', id='tablepress-1')
-        if not table: return None
-        all_rates_data = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5: continue
-            if not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                all_rates_data.append({'Bank Name': 'Alliance Finance', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                all_rates_data.append({'Bank Name': 'Alliance Finance', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
+        root = fetch_root(url, stop_after=('table', 'tablepress-1'))
+        rows = root.xpath('//table[@id="tablepress-1"]//tbody/tr')
+        if not rows: return None
+        all_rates_data = rate_records(rows, 'Alliance Finance', 'Standard', MONTHLY_THEN_MATURITY)
         if not all_rates_data: return None
-        print(f"--- SUCCESS: Alliance Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: Alliance Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: Alliance Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Alliance Finance scraper threw an error. --- \nError: %s", e)
         return None
 
-async def scrape_cdb_finance_fd_rates_final():
+async def scrape_cdb_finance_fd_rates_final(browser):
     """Scrapes CDB Finance rates using Playwright."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and '%' in rate_text:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*Month', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     url = 'https://www.cdb.lk/products/cards/fd/cdb-dsfd'
-    print(f"--- Starting: CDB Finance ---")
+    logger.info("--- Starting: CDB Finance ---")
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        context = await new_scraper_context(browser)
+        try:
+            page = await context.new_page()
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
             await page.wait_for_selector('div#collapsefirst', state='visible', timeout=20000)
-            html_content = await page.content()
-            await browser.close()
+            # Only the rates table is serialized and parsed, not the whole rendered page
+            table_html = await page.locator('div#collapsefirst table.table-striped').first.evaluate('el => el.outerHTML')
+        finally:
+            await context.close()
     except Exception as e:
-        print(f"--- FAILED: CDB Finance scraper (Playwright). --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: CDB Finance scraper (Playwright). --- \nError: %s", e)
         return None
-    soup = BeautifulSoup(html_content, 'lxml')
-    if not (interest_rates_accordion := soup.find('div', id='collapsefirst')) or not (table := interest_rates_accordion.find('table', class_='table-striped')): return None
-    all_rates_data = []
-    for tbody in table.find_all('tbody'):
-        if not (row := tbody.find('tr')): continue
-        cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-        if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-        if monthly_rate := clean_rate(cells[1]):
-            all_rates_data.append({'Bank Name': 'CDB Finance', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[3])})
-        if maturity_rate := clean_rate(cells[2]):
-            all_rates_data.append({'Bank Name': 'CDB Finance', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
+    rows = html.fromstring(table_html).xpath('./tbody/tr[1]')
+    if not rows: return None
+    all_rates_data = rate_records(rows, 'CDB Finance', 'Standard', ((1, 3, 'Monthly'), (2, 4, 'At Maturity')), clean=clean_percent_rate)
     if not all_rates_data: return None
-    print(f"--- SUCCESS: CDB Finance extracted {len(all_rates_data)} records.")
-    return pd.DataFrame(all_rates_data)
+    logger.info("--- SUCCESS: CDB Finance extracted %d records.", len(all_rates_data))
+    return all_rates_data
 
 def scrape_commercial_credit_fd_rates():
     """Scrapes Commercial Credit's Fixed Deposit rates."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip():
-            match = re.search(r'([\d.]+)', rate_text)
-            if match and (rate := float(match.group(1))) > 0: return rate
-        return None
     def parse_term_to_months(term_text):
         if isinstance(term_text, str):
-            match = re.search(r'(\d+)', term_text)
+            match = _INT_RE.search(term_text)
             return int(match.group(1)) if match else None
         return None
     url = 'https://www.cclk.lk/products/deposits/fixed-deposit/en'
-    print(f"--- Starting: Commercial Credit ---")
+    logger.info("--- Starting: Commercial Credit ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        rate_header = soup.find('h3', string=re.compile(r'Non Senior Citizen Rates', re.IGNORECASE))
-        if not rate_header or not (table := rate_header.find_next('table')): return None
-        all_rates_data = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                all_rates_data.append({'Bank Name': 'Commercial Credit', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                all_rates_data.append({'Bank Name': 'Commercial Credit', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
+        root = fetch_root(url)
+        rows = root.xpath(f'(//h3[contains({LOWER_TEXT}, "non senior citizen rates")])[1]/following::table[1]//tbody/tr')
+        if not rows: return None
+        all_rates_data = rate_records(rows, 'Commercial Credit', 'Standard', MONTHLY_THEN_MATURITY, clean=clean_positive_rate, parse_term=parse_term_to_months)
         if not all_rates_data: return None
-        print(f"--- SUCCESS: Commercial Credit extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: Commercial Credit extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: Commercial Credit scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Commercial Credit scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_dialog_finance_fd_rates():
     """Scrapes all FD rates from the Dialog Finance website."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', rate_text)
-            if match and (rate := float(match.group(1))) > 0: return rate
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*MONTH', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     def process_dialog_finance_table(table, fd_type):
-        records = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if maturity_rate := clean_rate(cells[1]):
-                records.append({'Bank Name': 'Dialog Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if monthly_rate := clean_rate(cells[3]):
-                records.append({'Bank Name': 'Dialog Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[4])})
-        return records
+        return rate_records(table.xpath('.//tbody/tr'), 'Dialog Finance', fd_type, MATURITY_THEN_MONTHLY, clean=clean_positive_rate)
     url = 'https://www.dialogfinance.lk/for-you/fixed-deposits'
-    print(f"--- Starting: Dialog Finance ---")
+    logger.info("--- Starting: Dialog Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        root = fetch_root(url)
         all_rates_data = []
-        for header in soup.find_all('h3', class_='section-title'):
-            header_text = header.get_text(strip=True).lower()
-            if not (table := header.find_next_sibling('div', class_='table-responsive')): continue
+        for header in root.xpath(f'//h3[{has_class("section-title")}]'):
+            header_text = header.text_content().strip().lower()
+            if not (tables := header.xpath(f'following-sibling::div[{has_class("table-responsive")}][1]')): continue
+            table = tables[0]
             if 'non-senior citizen' in header_text:
                 all_rates_data.extend(process_dialog_finance_table(table, 'Standard'))
             elif 'senior citizen' in header_text:
                 all_rates_data.extend(process_dialog_finance_table(table, 'Senior Citizen'))
         if not all_rates_data: return None
-        print(f"--- SUCCESS: Dialog Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: Dialog Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: Dialog Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Dialog Finance scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_hnb_finance_fd_rates():
     """Scrapes HNB Finance Fixed Deposit rates."""
-    def clean_rate(text):
-        if isinstance(text, str) and text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(text):
-        if isinstance(text, str):
-            match = re.search(r'(\d+)\s*Month', text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     def process_hnb_finance_table(table, fd_type):
-        records = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all(['th', 'td'])]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                records.append({'Bank Name': 'HNB Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                records.append({'Bank Name': 'HNB Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
-        return records
+        return rate_records(table.xpath('.//tbody/tr'), 'HNB Finance', fd_type, MONTHLY_THEN_MATURITY, cell_path='./td | ./th')
     url = 'https://www.hnbfinance.lk/fixed-deposits/'
-    print(f"--- Starting: HNB Finance ---")
+    logger.info("--- Starting: HNB Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        root = fetch_root(url)
         all_rates_data = []
-        standard_header = soup.find('h2', string='Interest Rates')
-        if standard_header and (standard_table := standard_header.find_next('table')):
-            all_rates_data.extend(process_hnb_finance_table(standard_table, 'Standard'))
-        senior_header = soup.find('h2', string='Interest Rates – Senior Citizens')
-        if senior_header and (senior_table := senior_header.find_next('table')):
-            all_rates_data.extend(process_hnb_finance_table(senior_table, 'Senior Citizen'))
+        # Both headers are found in one pass; only the first of each is used
+        fd_types = {'Interest Rates': 'Standard', 'Interest Rates – Senior Citizens': 'Senior Citizen'}
+        for header in root.xpath('//h2[normalize-space()="Interest Rates" or normalize-space()="Interest Rates – Senior Citizens"]'):
+            if (fd_type := fd_types.pop(' '.join(header.text_content().split()), None)) and (tables := header.xpath('following::table[1]')):
+                all_rates_data.extend(process_hnb_finance_table(tables[0], fd_type))
         if not all_rates_data: return None
-        print(f"--- SUCCESS: HNB Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: HNB Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: HNB Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: HNB Finance scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_janashakthi_fd_rates():
     """Scrapes Janashakthi Finance's Fixed Deposit rates."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            term_text = term_text.lower()
-            if 'year' in term_text: return int(re.search(r'(\d+)', term_text).group(1)) * 12
-            elif 'month' in term_text: return int(re.search(r'(\d+)', term_text).group(1))
-        return None
     def process_janashakthi_table(table, fd_type):
-        records = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                records.append({'Bank Name': 'Janashakthi Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                records.append({'Bank Name': 'Janashakthi Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
-        return records
+        return rate_records(table.xpath('.//tbody/tr'), 'Janashakthi Finance', fd_type, MONTHLY_THEN_MATURITY)
     url = 'https://www.janashakthifinance.lk/services/fixed-deposits/'
-    print(f"--- Starting: Janashakthi Finance ---")
+    logger.info("--- Starting: Janashakthi Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        root = fetch_root(url)
         all_rates_data = []
-        if (standard_container := soup.find('div', id='fd-pop-cont_fd_r_normal')) and (standard_table := standard_container.find('table')):
+        for standard_table in root.xpath('(//div[@id="fd-pop-cont_fd_r_normal"]//table)[1]'):
             all_rates_data.extend(process_janashakthi_table(standard_table, 'Standard'))
-        if (senior_container := soup.find('div', id='fd-pop-cont_fd_r_senior')) and (senior_table := senior_container.find('table')):
+        for senior_table in root.xpath('(//div[@id="fd-pop-cont_fd_r_senior"]//table)[1]'):
             all_rates_data.extend(process_janashakthi_table(senior_table, 'Senior Citizen'))
         if not all_rates_data: return None
-        print(f"--- SUCCESS: Janashakthi Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: Janashakthi Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: Janashakthi Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Janashakthi Finance scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_lolc_finance_fd_rates():
     """Scrapes all FD rates from the LOLC Finance website."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
     def parse_term_to_months(term_text):
         if isinstance(term_text, str):
-            match = re.search(r'^(\d+)', term_text.strip())
+            match = _INT_RE.match(term_text.strip())
             return int(match.group(1)) if match else None
         return None
     def process_lolc_table(table, fd_type):
-        records = []
-        for row in table.select('tbody > tr')[1:]: # Skip sub-header row
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 7 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                records.append({'Bank Name': 'LOLC Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if annually_rate := clean_rate(cells[3]):
-                records.append({'Bank Name': 'LOLC Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Annually', 'Interest Rate (p.a.)': annually_rate, 'Annual Effective Rate': clean_rate(cells[4])})
-            if maturity_rate := clean_rate(cells[5]):
-                records.append({'Bank Name': 'LOLC Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[6])})
-        return records
+        rows = islice(table.xpath('.//tbody/tr'), 1, None)  # Skip sub-header row
+        return rate_records(rows, 'LOLC Finance', fd_type, ((1, 2, 'Monthly'), (3, 4, 'Annually'), (5, 6, 'At Maturity')), parse_term=parse_term_to_months)
     url = 'https://www.lolcfinance.com/rates-and-returns/interest-rates/'
-    print(f"--- Starting: LOLC Finance ---")
+    logger.info("--- Starting: LOLC Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        root = fetch_root(url)
         all_rates_data = []
-        if (general_tab := soup.find('div', id='GeneralFD')) and (general_table := general_tab.find('table')):
+        for general_table in root.xpath('(//div[@id="GeneralFD"]//table)[1]'):
             all_rates_data.extend(process_lolc_table(general_table, 'Normal'))
-        if (senior_tab := soup.find('div', id='SCFD')) and (senior_table := senior_tab.find('table')):
+        for senior_table in root.xpath('(//div[@id="SCFD"]//table)[1]'):
             all_rates_data.extend(process_lolc_table(senior_table, 'Senior Citizen'))
         if not all_rates_data: return None
-        print(f"--- SUCCESS: LOLC Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: LOLC Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: LOLC Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: LOLC Finance scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_mbsl_fd_rates():
     """Scrapes all FD rates from the MBSL Bank website."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
     def parse_term_to_months(term_text):
         if isinstance(term_text, str) and 'day' not in term_text.lower():
-            match = re.search(r'(\d+)', term_text.strip())
+            match = _INT_RE.search(term_text.strip())
             return int(match.group(1)) if match else None
         return None
     def process_mbsl_table(table, fd_type):
-        records = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                records.append({'Bank Name': 'MBSL Bank', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                records.append({'Bank Name': 'MBSL Bank', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
-        return records
+        return rate_records(table.xpath('.//tbody/tr'), 'MBSL Bank', fd_type, MONTHLY_THEN_MATURITY, cell_path='./td | ./th', parse_term=parse_term_to_months)
     url = 'https://www.mbslbank.com/en/services/personal-services/deposits/fixed-deposits/'
-    print(f"--- Starting: MBSL Bank ---")
+    logger.info("--- Starting: MBSL Bank ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        all_tables = soup.find_all('table', class_='table-bordered')
+        root = fetch_root(url)
+        all_tables = root.xpath(f'//table[{has_class("table-bordered")}]')
         if len(all_tables) < 2: return None
         all_rates_data = []
         all_rates_data.extend(process_mbsl_table(all_tables[0], 'Normal'))
         all_rates_data.extend(process_mbsl_table(all_tables[1], 'Senior Citizen'))
         if not all_rates_data: return None
-        print(f"--- SUCCESS: MBSL Bank extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: MBSL Bank extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: MBSL Bank scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: MBSL Bank scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_mercantile_fd_rates():
     """Scrapes Mercantile Investments Fixed Deposit rates."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() and '%' in rate_text:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*Month', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     def process_mercantile_table(table, fd_type):
-        records = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                records.append({'Bank Name': 'Mercantile Investments', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                records.append({'Bank Name': 'Mercantile Investments', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
-        return records
+        return rate_records(table.xpath('.//tbody/tr'), 'Mercantile Investments', fd_type, MONTHLY_THEN_MATURITY, clean=clean_percent_rate)
     url = 'https://www.mi.com.lk/en/products-and-services/main-products/fixed-deposit'
-    print(f"--- Starting: Mercantile Investments ---")
+    logger.info("--- Starting: Mercantile Investments ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        root = fetch_root(url)
         all_rates_data = []
-        if (divimithuru_img := soup.find('img', src=re.compile(r'divimithuru-en.png'))) and (divimithuru_table := divimithuru_img.find_parent('div').find_next_sibling('div', class_='table-wrapper')):
+        table_after_img = f'(//img[contains(@src, "{{}}")])[1]/ancestor::div[1]/following-sibling::div[{has_class("table-wrapper")}][1]'
+        for divimithuru_table in root.xpath(table_after_img.format('divimithuru-en.png')):
             all_rates_data.extend(process_mercantile_table(divimithuru_table, 'Divimithuru (Standard)'))
-        if (kruthaguna_img := soup.find('img', src=re.compile(r'kruthaguna-en.png'))) and (kruthaguna_table := kruthaguna_img.find_parent('div').find_next_sibling('div', class_='table-wrapper')):
+        for kruthaguna_table in root.xpath(table_after_img.format('kruthaguna-en.png')):
             all_rates_data.extend(process_mercantile_table(kruthaguna_table, 'Kruthaguna (Senior Citizen)'))
         if not all_rates_data: return None
-        print(f"--- SUCCESS: Mercantile Investments extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: Mercantile Investments extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: Mercantile Investments scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Mercantile Investments scraper threw an error. --- \nError: %s", e)
         return None
 
-async def scrape_nation_lanka_fd_rates_final():
+async def scrape_nation_lanka_fd_rates_final(browser):
     """Scrapes rates using Playwright to handle the JavaScript-rendered table."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() and '%' in rate_text:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*Month', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     url = 'https://www.nationlanka.com/deposits'
-    print(f"--- Starting: Nation Lanka Finance ---")
+    logger.info("--- Starting: Nation Lanka Finance ---")
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        context = await new_scraper_context(browser)
+        try:
+            page = await context.new_page()
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
             await page.wait_for_selector('table >> th:has-text("Period")', state='visible', timeout=20000)
-            html_content = await page.content()
-            await browser.close()
+            # Only the rates table is serialized and parsed, not the whole rendered page
+            table_html = await page.locator('table.table-auto').first.evaluate('el => el.outerHTML')
+        finally:
+            await context.close()
     except Exception as e:
-        print(f"--- FAILED: Nation Lanka Finance scraper (Playwright). --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Nation Lanka Finance scraper (Playwright). --- \nError: %s", e)
         return None
-    soup = BeautifulSoup(html_content, 'lxml')
-    if not (rates_table := soup.find('table', class_='table-auto')): return None
+    rates_table = html.fromstring(table_html)
     all_rates_data = []
-    header_cells = rates_table.select_one('thead > tr').find_all('th')
-    payout_schedules = [cell.get_text(strip=True) for cell in header_cells[1:]]
-    for row in rates_table.select('tbody > tr'):
-        cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
+    header_cells = rates_table.xpath('(.//thead/tr)[1]/th')
+    payout_schedules = [th.text_content().strip() for th in header_cells[1:]]
+    for row in rates_table.xpath('.//tbody/tr'):
+        cells = [cell.text_content().strip() for cell in ROW_CELLS(row)]
         if len(cells) < len(header_cells) or not (term_months := parse_term_to_months(cells[0])): continue
-        for i, rate_text in enumerate(cells[1:]):
-            if rate := clean_rate(rate_text):
-                all_rates_data.append({'Bank Name': 'Nation Lanka Finance', 'FD Type': 'Non-Senior Citizen', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': payout_schedules[i], 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': None})
+        # Extra cells past the header's columns have no schedule and are ignored
+        for payout_schedule, rate in zip(payout_schedules, map(clean_percent_rate, cells[1:])):
+            if rate:
+                all_rates_data.append({'Bank Name': 'Nation Lanka Finance', 'FD Type': 'Non-Senior Citizen', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': payout_schedule, 'Interest Rate (p.a.)': rate, 'Annual Effective Rate': None})
     if not all_rates_data: return None
-    print(f"--- SUCCESS: Nation Lanka Finance extracted {len(all_rates_data)} records.")
-    return pd.DataFrame(all_rates_data)
+    logger.info("--- SUCCESS: Nation Lanka Finance extracted %d records.", len(all_rates_data))
+    return all_rates_data
 
 def scrape_plc_fd_rates():
     """Scrapes People's Leasing & Finance PLC Fixed Deposit rates."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
     def parse_term_to_months(term_text):
         if isinstance(term_text, str) and 'month' in term_text.lower():
-            match = re.search(r'(\d+)', term_text)
+            match = _INT_RE.search(term_text)
             return int(match.group(1)) if match else None
         return None
     url = 'https://www.plc.lk/products/fixed-deposits-savings/fixed-deposits/'
-    print(f"--- Starting: People's Leasing & Finance (PLC) ---")
+    logger.info("--- Starting: People's Leasing & Finance (PLC) ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        fd_header = soup.find('h4', class_='wp-block-heading', string='Normal Fixed Deposit')
-        if not fd_header or not (table := fd_header.find_next_sibling('table')): return None
-        all_rates_data = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if maturity_rate := clean_rate(cells[1]):
-                all_rates_data.append({'Bank Name': "People's Leasing & Finance", 'FD Type': 'Normal', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if monthly_rate := clean_rate(cells[3]):
-                all_rates_data.append({'Bank Name': "People's Leasing & Finance", 'FD Type': 'Normal', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[4])})
+        root = fetch_root(url)
+        rows = root.xpath(f'(//h4[{has_class("wp-block-heading")}][normalize-space()="Normal Fixed Deposit"])[1]/following-sibling::table[1]//tbody/tr')
+        if not rows: return None
+        all_rates_data = rate_records(rows, "People's Leasing & Finance", 'Normal', MATURITY_THEN_MONTHLY, parse_term=parse_term_to_months)
         if not all_rates_data: return None
-        print(f"--- SUCCESS: PLC extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: PLC extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: PLC scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: PLC scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_pmf_fd_rates():
     """Scrapes PMF Finance's Fixed Deposit rates."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() and '%' in rate_text:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*Month', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     def process_pmf_table(table, fd_type):
-        records = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                records.append({'Bank Name': 'PMF Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                records.append({'Bank Name': 'PMF Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
-        return records
+        return rate_records(table.xpath('.//tbody/tr'), 'PMF Finance', fd_type, MONTHLY_THEN_MATURITY, clean=clean_percent_rate)
     url = 'https://pmf.lk/en/fixed-deposit/'
-    print(f"--- Starting: PMF Finance ---")
+    logger.info("--- Starting: PMF Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        root = fetch_root(url)
         all_rates_data = []
-        if (standard_div := soup.find('div', id='normal-fd-rates-table')) and (standard_table := standard_div.find('table')):
+        for standard_table in root.xpath('(//div[@id="normal-fd-rates-table"]//table)[1]'):
             all_rates_data.extend(process_pmf_table(standard_table, 'Standard'))
-        if (senior_div := soup.find('div', id='se-citizen-fd-rates-table')) and (senior_table := senior_div.find('table')):
+        for senior_table in root.xpath('(//div[@id="se-citizen-fd-rates-table"]//table)[1]'):
             all_rates_data.extend(process_pmf_table(senior_table, 'Senior Citizen'))
         if not all_rates_data: return None
-        print(f"--- SUCCESS: PMF Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: PMF Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: PMF Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: PMF Finance scraper threw an error. --- \nError: %s", e)
         return None
 
-async def scrape_senkadagala_fd_rates_final():
+async def scrape_senkadagala_fd_rates_final(browser):
     """Scrapes rates using Playwright to handle JavaScript rendering."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*months?', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     def process_senkadagala_table(table, fd_type):
         records = []
-        for row in table.find_all('tr')[1:]:
-            cells = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
+        for row in islice(table.xpath('.//tr'), 1, None):
+            cells = [cell.text_content().strip() for cell in ROW_CELLS_AND_HEADERS(row)]
             if any('period' in c.lower() for c in cells) or len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
             if monthly_rate := clean_rate(cells[1]):
                 records.append({'Bank Name': 'Senkadagala Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
@@ -1109,183 +960,105 @@ async def scrape_senkadagala_fd_rates_final():
                 records.append({'Bank Name': 'Senkadagala Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
         return records
     url = 'https://www.senfin.com/personal.html'
-    print(f"--- Starting: Senkadagala Finance ---")
+    logger.info("--- Starting: Senkadagala Finance ---")
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        context = await new_scraper_context(browser)
+        try:
+            page = await context.new_page()
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
             await page.wait_for_selector('table#SeniorDeposits', state='visible', timeout=20000)
             await page.wait_for_selector('table#GeneralDeposits', state='visible', timeout=20000)
             html_content = await page.content()
-            await browser.close()
+        finally:
+            await context.close()
     except Exception as e:
-        print(f"--- FAILED: Senkadagala Finance scraper (Playwright). --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Senkadagala Finance scraper (Playwright). --- \nError: %s", e)
         return None
-    soup = BeautifulSoup(html_content, 'lxml')
+    root = html.fromstring(html_content)
     all_rates_data = []
-    if senior_table := soup.find('table', id='SeniorDeposits'):
+    for senior_table in root.xpath('//table[@id="SeniorDeposits"]'):
         all_rates_data.extend(process_senkadagala_table(senior_table, 'Senior Citizen'))
-    if general_table := soup.find('table', id='GeneralDeposits'):
+    for general_table in root.xpath('//table[@id="GeneralDeposits"]'):
         all_rates_data.extend(process_senkadagala_table(general_table, 'General'))
     if not all_rates_data: return None
-    print(f"--- SUCCESS: Senkadagala Finance extracted {len(all_rates_data)} records.")
-    return pd.DataFrame(all_rates_data)
+    logger.info("--- SUCCESS: Senkadagala Finance extracted %d records.", len(all_rates_data))
+    return all_rates_data
 
 def scrape_singer_finance_fd_rates():
     """Scrapes Singer Finance's Fixed Deposit rates."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() and '%' in rate_text:
-            match = re.search(r'([\d.]+)', rate_text)
-            if match and (rate := float(match.group(1))) > 0: return rate
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*Month', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     url = 'https://singerfinance.com/en/products/fixed-deposit/standard-fixed-deposits'
-    print(f"--- Starting: Singer Finance ---")
+    logger.info("--- Starting: Singer Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        rate_header = soup.find('h2', string='Interest Paid Rate')
-        if not rate_header or not (table := rate_header.find_next('table', class_='rating-table__wrap')): return None
-        all_rates_data = []
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                all_rates_data.append({'Bank Name': 'Singer Finance', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                all_rates_data.append({'Bank Name': 'Singer Finance', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
+        root = fetch_root(url)
+        rows = root.xpath(f'(//h2[normalize-space()="Interest Paid Rate"])[1]/following::table[{has_class("rating-table__wrap")}][1]//tbody/tr')
+        if not rows: return None
+        all_rates_data = rate_records(rows, 'Singer Finance', 'Standard', MONTHLY_THEN_MATURITY, clean=clean_positive_percent_rate)
         if not all_rates_data: return None
-        print(f"--- SUCCESS: Singer Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: Singer Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: Singer Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Singer Finance scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_siyapatha_finance_fd_rates():
     """Scrapes all FD rates from the Siyapatha Finance website."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() and '%' in rate_text:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*Month', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     def process_siyapatha_div_table(div_container, fd_type):
-        records = []
-        for row_div in div_container.find_all('div', class_='col-sm-12')[2:]:
-            cells = [cell.get_text(strip=True) for cell in row_div.find_all('div', class_='col')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if maturity_rate := clean_rate(cells[1]):
-                records.append({'Bank Name': 'Siyapatha Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if monthly_rate := clean_rate(cells[3]):
-                records.append({'Bank Name': 'Siyapatha Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[4])})
-        return records
+        row_divs = islice(div_container.xpath(f'.//div[{has_class("col-sm-12")}]'), 2, None)
+        return rate_records(row_divs, 'Siyapatha Finance', fd_type, MATURITY_THEN_MONTHLY, cell_path=f'.//div[{has_class("col")}]', clean=clean_percent_rate)
     url = 'https://www.siyapatha.lk/fixed-deposits/'
-    print(f"--- Starting: Siyapatha Finance ---")
+    logger.info("--- Starting: Siyapatha Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        root = fetch_root(url)
         all_rates_data = []
-        if (general_header := soup.find('h5', string=re.compile(r'General Public', re.IGNORECASE))) and (general_table_container := general_header.find_next_sibling('div', class_='b_ron')):
+        container_after_header = f'(//h5[contains({LOWER_TEXT}, "{{}}")])[1]/following-sibling::div[{has_class("b_ron")}][1]'
+        for general_table_container in root.xpath(container_after_header.format('general public')):
             all_rates_data.extend(process_siyapatha_div_table(general_table_container, 'General Public'))
-        if (senior_header := soup.find('h5', string=re.compile(r'Senior Citizens', re.IGNORECASE))) and (senior_table_container := senior_header.find_next_sibling('div', class_='b_ron')):
+        for senior_table_container in root.xpath(container_after_header.format('senior citizens')):
             all_rates_data.extend(process_siyapatha_div_table(senior_table_container, 'Senior Citizen'))
         if not all_rates_data: return None
-        print(f"--- SUCCESS: Siyapatha Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: Siyapatha Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: Siyapatha Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Siyapatha Finance scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_smb_finance_fd_rates():
     """Scrapes SMB Finance PLC's Fixed Deposit rates."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() and '%' not in rate_text: rate_text += '%'
-        if isinstance(rate_text, str) and rate_text.strip():
-            match = re.search(r'([\d.]+)', rate_text)
-            if match and (rate := float(match.group(1))) > 0: return rate
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            match = re.search(r'(\d+)\s*Month', term_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-        return None
     url = 'https://www.smblk.com/products-services/fixed-deposits/'
-    print(f"--- Starting: SMB Finance ---")
+    logger.info("--- Starting: SMB Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        rates_table = next((table for table in soup.find_all('table', class_='tablebg') if (th := table.find('th')) and 'period' in th.get_text(strip=True).lower()), None)
-        if not rates_table: return None
-        all_rates_data = []
-        for row in rates_table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                all_rates_data.append({'Bank Name': 'SMB Finance', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                all_rates_data.append({'Bank Name': 'SMB Finance', 'FD Type': 'Standard', 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
+        root = fetch_root(url)
+        rows = root.xpath(f'(//table[{has_class("tablebg")}][(.//th)[1][contains({LOWER_TEXT}, "period")]])[1]//tbody/tr')
+        if not rows: return None
+        all_rates_data = rate_records(rows, 'SMB Finance', 'Standard', MONTHLY_THEN_MATURITY, clean=clean_positive_rate)
         if not all_rates_data: return None
-        print(f"--- SUCCESS: SMB Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: SMB Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: SMB Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: SMB Finance scraper threw an error. --- \nError: %s", e)
         return None
 
 def scrape_vallibel_finance_fd_rates():
     """Scrapes all FD rates from the Vallibel Finance website."""
-    def clean_rate(rate_text):
-        if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-            match = re.search(r'([\d.]+)', rate_text)
-            return float(match.group(1)) if match else None
-        return None
-    def parse_term_to_months(term_text):
-        if isinstance(term_text, str):
-            term_text = term_text.lower()
-            match = re.search(r'(\d+)\s*(month|year)', term_text, re.IGNORECASE)
-            if match:
-                value, unit = int(match.group(1)), match.group(2)
-                return value * 12 if 'year' in unit else value
-        return None
     def process_vallibel_table(table_container):
-        records = []
-        if not (header := table_container.find('h3')) or not (table := table_container.find('table', class_='rg-table')): return records
-        fd_type = header.get_text(strip=True)
-        for row in table.select('tbody > tr'):
-            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
-            if len(cells) != 5 or not (term_months := parse_term_to_months(cells[0])): continue
-            if monthly_rate := clean_rate(cells[1]):
-                records.append({'Bank Name': 'Vallibel Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'Monthly', 'Interest Rate (p.a.)': monthly_rate, 'Annual Effective Rate': clean_rate(cells[2])})
-            if maturity_rate := clean_rate(cells[3]):
-                records.append({'Bank Name': 'Vallibel Finance', 'FD Type': fd_type, 'Institution Type': 'Finance Company', 'Term (Months)': term_months, 'Payout Schedule': 'At Maturity', 'Interest Rate (p.a.)': maturity_rate, 'Annual Effective Rate': clean_rate(cells[4])})
-        return records
+        headers = table_container.xpath('(.//h3)[1]')
+        tables = table_container.xpath(f'(.//table[{has_class("rg-table")}])[1]')
+        if not headers or not tables: return []
+        return rate_records(tables[0].xpath('.//tbody/tr'), 'Vallibel Finance', headers[0].text_content().strip(), MONTHLY_THEN_MATURITY)
     url = 'https://www.vallibelfinance.com/product/fixed-deposits'
-    print(f"--- Starting: Vallibel Finance ---")
+    logger.info("--- Starting: Vallibel Finance ---")
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=20)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        rate_containers = soup.find_all('div', class_='rg-container')
+        root = fetch_root(url)
+        rate_containers = root.xpath(f'//div[{has_class("rg-container")}]')
         if not rate_containers: return None
         all_rates_data = []
         for container in rate_containers:
             all_rates_data.extend(process_vallibel_table(container))
         if not all_rates_data: return None
-        print(f"--- SUCCESS: Vallibel Finance extracted {len(all_rates_data)} records.")
-        return pd.DataFrame(all_rates_data)
+        logger.info("--- SUCCESS: Vallibel Finance extracted %d records.", len(all_rates_data))
+        return all_rates_data
     except Exception as e:
-        print(f"--- FAILED: Vallibel Finance scraper threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("--- FAILED: Vallibel Finance scraper threw an error. --- \nError: %s", e)
         return None
 
 
@@ -1297,27 +1070,28 @@ async def main():
     Main function to run all scrapers and upload results to Supabase individually.
     """
     # --- PART 1: Initialize Supabase Client ---
+    use_orjson_encoder()
     try:
         # Get secrets from environment variables (set by GitHub Actions)
         supabase_url = os.environ.get("SUPABASE_URL")
         supabase_key = os.environ.get("SUPABASE_SERVICE_KEY")
         
         if not supabase_url or not supabase_key:
-            print("---!!! FAILED to initialize Supabase. SUPABASE_URL or SUPABASE_SERVICE_KEY not set. !!!---", file=sys.stderr)
-            print("---!!! Make sure you set these in your GitHub Actions secrets. !!!---", file=sys.stderr)
+            logger.error("---!!! FAILED to initialize Supabase. SUPABASE_URL or SUPABASE_SERVICE_KEY not set. !!!---")
+            logger.error("---!!! Make sure you set these in your GitHub Actions secrets. !!!---")
             return
 
         supabase_client: Client = create_client(supabase_url, supabase_key)
-        print("✅ Supabase client initialized successfully.")
+        logger.info("✅ Supabase client initialized successfully.")
     except Exception as e:
-        print(f"---!!! FAILED to initialize Supabase. !!!---", file=sys.stderr)
-        print(f"Error: {e}", file=sys.stderr)
+        logger.error("---!!! FAILED to initialize Supabase. !!!---")
+        logger.error("Error: %s", e)
         return
 
     # --- PART 2: Define and Run All Scrapers ---
-    print("\n>>> ========================================================== <<<")
-    print(">>> Starting All Bank & Finance Company FD Rate Scrapers... <<<")
-    print(">>> ========================================================== <<<")
+    logger.info("\n>>> ========================================================== <<<")
+    logger.info(">>> Starting All Bank & Finance Company FD Rate Scrapers... <<<")
+    logger.info(">>> ========================================================== <<<")
     
     # We group scrapers by their function call to link results back
     sync_scrapers = {
@@ -1352,49 +1126,63 @@ async def main():
         "Senkadagala Finance": scrape_senkadagala_fd_rates_final,
     }
     
-    # Create tasks for all scrapers
-    sync_tasks = [asyncio.to_thread(func) for func in sync_scrapers.values()]
-    async_tasks = [func() for func in async_scrapers.values()]
-    
     # Link names back to the tasks
     all_scraper_names = list(sync_scrapers.keys()) + list(async_scrapers.keys())
-    all_tasks = sync_tasks + async_tasks
-    
-    print(f"--- Running {len(all_tasks)} scrapers in parallel... ---")
-    results = await asyncio.gather(*all_tasks, return_exceptions=True)
+
+    # The sync scrapers spend nearly all their time waiting on the network, so give
+    # each one its own thread; the default executor only has cpu_count + 4 workers
+    # and would otherwise queue most of them behind each other
+    loop = asyncio.get_running_loop()
+    # The Playwright scrapers share one Chromium process, each in its own context
+    # so cookies and storage stay isolated, instead of launching a browser apiece
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        with ThreadPoolExecutor(max_workers=len(sync_scrapers), thread_name_prefix='scraper') as executor:
+            sync_tasks = [loop.run_in_executor(executor, func) for func in sync_scrapers.values()]
+            async_tasks = [func(browser) for func in async_scrapers.values()]
+            all_tasks = sync_tasks + async_tasks
+
+            logger.info("--- Running %d scrapers in parallel... ---", len(all_tasks))
+            results = await asyncio.gather(*all_tasks, return_exceptions=True)
+        await browser.close()
+    HTTP_CLIENT.close()
     
     # --- PART 3: Process and Upload Results Individually ---
-    print("\n>>> ============================================== <<<")
-    print(">>> Scraping Complete. Processing and Uploading... <<<")
-    print(">>> ============================================== <<<")
+    logger.info("\n>>> ============================================== <<<")
+    logger.info(">>> Scraping Complete. Processing and Uploading... <<<")
+    logger.info(">>> ============================================== <<<")
     
     successful_scrapes = 0
     failed_scrapes = 0
-    upload_tasks = []
+    records_to_upload = {}
 
     for name, result in zip(all_scraper_names, results):
         if isinstance(result, Exception):
-            print(f"---! FAILED (Scrape): '{name}' threw an exception: {result}", file=sys.stderr)
+            logger.error("---! FAILED (Scrape): '%s' threw an exception: %s", name, result)
             failed_scrapes += 1
-        elif isinstance(result, pd.DataFrame) and not result.empty:
-            print(f"---✅ SUCCESS (Scrape): '{name}' returned {len(result)} records.")
+        elif isinstance(result, list) and result:
+            logger.info("---✅ SUCCESS (Scrape): '%s' returned %d records.", name, len(result))
             successful_scrapes += 1
-            # Add the atomic upload as a new task
-            upload_tasks.append(update_supabase_for_institution(supabase_client, result, name))
+            records_to_upload[name] = result
         else:
-            print(f"---! FAILED (Scrape): '{name}' returned no data or an invalid result.")
+            logger.warning("---! FAILED (Scrape): '%s' returned no data or an invalid result.", name)
             failed_scrapes += 1
             
     # --- PART 4: Run all uploads in parallel ---
-    if upload_tasks:
-        print(f"\n--- Starting {len(upload_tasks)} Supabase uploads in parallel... ---")
-        await asyncio.gather(*upload_tasks)
+    if records_to_upload:
+        logger.info("\n--- Starting %d Supabase uploads in parallel... ---", len(records_to_upload))
+        await upload_all(supabase_client, records_to_upload)
     
-    print("\n\n--- MASTER SCRIPT FINISHED ---")
-    print(f"✅ Successful Scrapes: {successful_scrapes}")
-    print(f"❌ Failed Scrapes: {failed_scrapes}")
-    print(f"--- Run complete. ---")
+    logger.info("\n\n--- MASTER SCRIPT FINISHED ---")
+    logger.info("✅ Successful Scrapes: %d", successful_scrapes)
+    logger.info("❌ Failed Scrapes: %d", failed_scrapes)
+    logger.info("--- Run complete. ---")
 
 
+# Run as a module (python -m scraper.fd_scraper_v2) so the package imports resolve
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = start_logging()
+    try:
+        asyncio.run(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -1,8 +1,7 @@
 import asyncio
 import os
-import sys
+import logging
 from supabase import create_client, Client
-import pandas as pd
 from datetime import datetime
 
 # --- Imports are now simple and relative ---
@@ -12,9 +11,11 @@ from .commercial_bank import CommercialBankScraper
 # TODO: from .hnb import HNBScraper
 # ... add all 26 relative imports here ...
 
-from .utils import clean_and_rename_df
+from .utils import clean_records, replace_institution_rates, use_orjson_encoder, start_logging
 from .base import BaseScraper
 
+logger = logging.getLogger('scraper')
+
 
 async def run_scraper_orchestrator():
     """
@@ -23,6 +24,7 @@ async def run_scraper_orchestrator():
     """
     
     # 1. Initialize Supabase
+    use_orjson_encoder()
     try:
         supabase_url = os.environ.get("SUPABASE_URL")
         supabase_key = os.environ.get("SUPABASE_SERVICE_KEY")
@@ -30,9 +32,9 @@ async def run_scraper_orchestrator():
             raise ValueError("Supabase URL/Key not set in environment variables")
         
         supabase_client: Client = create_client(supabase_url, supabase_key)
-        print("✅ Supabase client initialized.")
+        logger.info("✅ Supabase client initialized.")
     except Exception as e:
-        print(f"---!!! FAILED to initialize Supabase. !!!--- \nError: {e}", file=sys.stderr)
+        logger.error("---!!! FAILED to initialize Supabase. !!!--- \nError: %s", e)
         return
 
     # 2. This list is your "To-Do" list.
@@ -42,7 +44,7 @@ async def run_scraper_orchestrator():
         # TODO: Add all 26 of your scraper objects here
     ]
 
-    print(f"\n>>> Starting all {len(scrapers_to_run)} scrapers... <<<")
+    logger.info("\n>>> Starting all %d scrapers... <<<", len(scrapers_to_run))
     
     # 3. This loop runs each scraper one by one, in isolation.
     all_logs = [s.get_log_data() for s in scrapers_to_run]
@@ -52,10 +54,19 @@ async def run_scraper_orchestrator():
         tasks.append(run_single_scraper(supabase_client, scraper, all_logs[i]))
 
     # Run all scraper tasks in parallel
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # Every scraper shares one HTTP client and one browser; close them once they're all done
+        await BaseScraper.close_client()
+        await BaseScraper.close_browser()
+        try:
+            BaseScraper.save_cache()
+        except Exception as e:
+            logger.warning("---! WARNING: Could not save the page cache; pages uploaded this run will be uploaded again next run. \nError: %s", e)
     
     # 4. Upload all the logs to your dashboard table in one go
-    print("\n\n>>> Scraping complete. Uploading logs to dashboard... <<<")
+    logger.info("\n\n>>> Scraping complete. Uploading logs to dashboard... <<<")
     try:
         for log in all_logs:
             log['lastRun'] = datetime.now().isoformat()
@@ -63,11 +74,11 @@ async def run_scraper_orchestrator():
         await asyncio.to_thread(
             supabase_client.from_("scraper_logs").upsert(all_logs, on_conflict="name").execute
         )
-        print("✅ Successfully updated scraper_logs dashboard.")
+        logger.info("✅ Successfully updated scraper_logs dashboard.")
     except Exception as e:
-        print(f"---! FAILED (Log Upload): Could not update dashboard. \nError: {e}", file=sys.stderr)
+        logger.error("---! FAILED (Log Upload): Could not update dashboard. \nError: %s", e)
     
-    print("\n--- MASTER SCRIPT FINISHED ---")
+    logger.info("\n--- MASTER SCRIPT FINISHED ---")
 
 
 async def run_single_scraper(supabase_client: Client, scraper: BaseScraper, log_entry: dict):
@@ -75,34 +86,36 @@ async def run_single_scraper(supabase_client: Client, scraper: BaseScraper, log_
     A helper function to run one scraper and handle its success or failure.
     """
     try:
-        df = await scraper.scrape()
+        records = await scraper.scrape()
+
+        if scraper.unchanged:
+            logger.info("---= SKIPPED (Scrape): '%s' page is unchanged since the last upload.", scraper.name)
+            log_entry['status'] = 'Unchanged'
+            return
         
-        if df.empty:
-            print(f"---! FAILED (Scrape): '{scraper.name}' returned no data.")
+        if not records:
+            logger.warning("---! FAILED (Scrape): '%s' returned no data.", scraper.name)
             log_entry['status'] = 'Failed'
             log_entry['errorMessage'] = 'No data extracted'
             return
 
-        records = clean_and_rename_df(df).to_dict('records')
-        
-        await asyncio.to_thread(
-            supabase_client.from_("public-rates").delete().eq("bankName", scraper.name).execute
-        )
-        
-        await asyncio.to_thread(
-            supabase_client.from_("public-rates").insert(records).execute
-        )
+        records = await replace_institution_rates(supabase_client, scraper.name, clean_records(records))
 
-        print(f"---✅ SUCCESS (Scrape): '{scraper.name}' updated {len(records)} records.")
+        logger.info("---✅ SUCCESS (Scrape): '%s' updated %d records.", scraper.name, len(records))
         log_entry['status'] = 'Success'
         log_entry['recordsUpdated'] = len(records)
         log_entry['errorMessage'] = 'N/A'
+        scraper.remember_page()
 
     except Exception as e:
-        print(f"---! FAILED (Scrape): '{scraper.name}' threw an error. --- \nError: {e}", file=sys.stderr)
+        logger.error("---! FAILED (Scrape): '%s' threw an error. --- \nError: %s", scraper.name, e)
         log_entry['status'] = 'Failed'
         log_entry['errorMessage'] = str(e)
 
 
 if __name__ == "__main__":
-    asyncio.run(run_scraper_orchestrator())
\ No newline at end of file
+    log_listener = start_logging()
+    try:
+        asyncio.run(run_scraper_orchestrator())
+    finally:
+        log_listener.stop()
\ No newline at end of file
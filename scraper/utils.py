@@ -1,54 +1,264 @@
+import asyncio
+import logging
+import logging.handlers
+import queue
 import re
-import pandas as pd
+from functools import lru_cache
+import httpx
+import orjson
+from httpx import _content as httpx_content
 
+logger = logging.getLogger('scraper')
+
+def start_logging():
+    """
+    Sends the 'scraper' logger through a queue that a background thread drains to
+    stderr, so concurrent scrapers never wait on each other to write a log line.
+    Returns the QueueListener; call .stop() on it at shutdown to flush what's left.
+    """
+    log_queue = queue.SimpleQueue()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+_NUM_RE = re.compile(r'([\d.]+)')
+# A term's number and unit in either order, optionally hyphenated ("6 Months",
+# "1-Year", "Year 1"); the first match wins, so "24 Months (2 Years)" reads as 24
+_TERM_RE = re.compile(r'(\d+)\s*[-–]?\s*(year|month)|(year|month)s?\s*[-–:]?\s*(\d+)', re.IGNORECASE)
+# Cell contents that mean "no rate offered"
+_RATE_PLACEHOLDERS = frozenset(('-', '–', ''))
+
+# Both parsers are pure functions of the cell text, and the same few term labels
+# and rates repeat across rows, tables and scrapers, so repeats are a dict lookup
+@lru_cache(maxsize=256)
 def clean_rate(rate_text):
     """
     Cleans a string to find a float (e.g., "14.5% p.a." -> 14.5)
     """
-    if isinstance(rate_text, str) and rate_text.strip() not in ['-', '–']:
-        match = re.search(r'([\d.]+)', rate_text)
-        return float(match.group(1)) if match else None
-    return None
+    try:
+        rate_text = rate_text.strip()
+    except AttributeError:  # not a string, e.g. a missing cell
+        return None
+    if rate_text in _RATE_PLACEHOLDERS:
+        return None
+    match = _NUM_RE.search(rate_text)
+    return float(match.group(1)) if match else None
+
+def clean_percent_rate(rate_text):
+    """
+    Like clean_rate, but only for cells that actually show a percentage.
+    """
+    try:
+        if '%' not in rate_text:
+            return None
+    except TypeError:  # not a string
+        return None
+    match = _NUM_RE.search(rate_text)
+    return float(match.group(1)) if match else None
+
+def clean_positive_rate(rate_text):
+    """
+    Like clean_rate, for sites where a zero rate also means "not offered".
+    """
+    return clean_rate(rate_text) or None
+
+def clean_positive_percent_rate(rate_text):
+    """
+    Like clean_percent_rate, for sites where a zero rate also means "not offered".
+    """
+    return clean_percent_rate(rate_text) or None
 
+@lru_cache(maxsize=256)
 def parse_term_to_months(term_text):
     """
     Parses a string to find the number of months (e.g., "1 Year" -> 12)
+
+    >>> [parse_term_to_months(t) for t in ("6 Months", "1-Year", "3-Months", "06-month", "Year 1")]
+    [6, 12, 3, 6, 12]
+    >>> parse_term_to_months("24 Months (2 Years)")
+    24
     """
-    if not isinstance(term_text, str):
+    try:
+        match = _TERM_RE.search(term_text)
+    except TypeError:  # not a string
+        return None
+    if not match:
         return None
-        
-    term_text = term_text.lower()
-    
-    if 'year' in term_text:
-        match = re.search(r'(\d+)', term_text)
-        return int(match.group(1)) * 12 if match else None
-    elif 'month' in term_text:
-        match = re.search(r'(\d+)', term_text)
-        return int(match.group(1)) if match else None
-    
-    return None
-
-def clean_and_rename_df(df):
-    """
-    Standardizes the DataFrame before it's uploaded to Supabase.
-    """
-    df_renamed = df.rename(columns={
-        'Bank Name': 'bankName',
-        'FD Type': 'fdType',
-        'Institution Type': 'institutionType',
-        'Term (Months)': 'termMonths',
-        'Payout Schedule': 'payoutSchedule',
-        'Interest Rate (p.a.)': 'interestRate',
-        'Annual Effective Rate': 'aer'
-    })
-    
-    # Ensure all required columns exist, add if missing
-    required_cols = ['bankName', 'fdType', 'institutionType', 'termMonths', 'payoutSchedule', 'interestRate', 'aer']
-    for col in required_cols:
-        if col not in df_renamed.columns:
-            df_renamed[col] = None
-            
-    # Select only the required columns and handle NaN/NaT
-    df_final = df_renamed[required_cols]
-    df_final = df_final.where(pd.notna(df_final), None)
-    return df_final.sort_values(by=['bankName', 'termMonths']).reset_index(drop=True)
\ No newline at end of file
+    number, unit = match.group(1, 2) if match.group(1) else match.group(4, 3)
+    months = int(number)
+    return months * 12 if unit.lower() == 'year' else months
+
+def new_rate_columns():
+    """
+    Returns an empty column-oriented (dict of lists) store for scraped records.
+    'Bank Name' and 'Institution Type' are constant per scraper, so they are
+    filled in once when the DataFrame is built rather than per row.
+    """
+    return {
+        'FD Type': [],
+        'Term (Months)': [],
+        'Payout Schedule': [],
+        'Interest Rate (p.a.)': [],
+        'Annual Effective Rate': []
+    }
+
+def append_rate(cols, fd_type, term_months, payout_schedule, rate, aer):
+    """
+    Appends one record to a store created by new_rate_columns().
+    """
+    cols['FD Type'].append(fd_type)
+    cols['Term (Months)'].append(term_months)
+    cols['Payout Schedule'].append(payout_schedule)
+    cols['Interest Rate (p.a.)'].append(rate)
+    cols['Annual Effective Rate'].append(aer)
+
+def extract_rows(table, width, skip_first_row=False, separator=''):
+    """
+    Pulls every <td> under a selectolax table's <tbody> with one CSS query and
+    groups their text by parent row, keeping only rows with exactly `width` cells.
+    Set skip_first_row to drop the first <tbody> row (e.g. a sub-header), and
+    separator to join a cell's text nodes (e.g. across <br>) with something other than ''.
+    """
+    skipped = None
+    if skip_first_row and (first_row := table.css_first('tbody > tr')):
+        skipped = first_row.mem_id
+
+    rows = {}
+    for cell in table.css('tbody > tr > td'):
+        row_id = cell.parent.mem_id
+        if row_id != skipped:
+            rows.setdefault(row_id, []).append(cell.text(separator=separator, strip=True))
+    return [cells for cells in rows.values() if len(cells) == width]
+
+# Scraper column names -> Supabase column names (also the upload column order)
+COLUMN_RENAMES = {
+    'Bank Name': 'bankName',
+    'FD Type': 'fdType',
+    'Institution Type': 'institutionType',
+    'Term (Months)': 'termMonths',
+    'Payout Schedule': 'payoutSchedule',
+    'Interest Rate (p.a.)': 'interestRate',
+    'Annual Effective Rate': 'aer'
+}
+
+def clean_records(records):
+    """
+    Standardizes raw scraper records for Supabase without going through pandas.
+    Renames the keys, fills missing fields and NaN with None, and sorts by bank then term.
+    """
+    cleaned = []
+    for record in records:
+        row = {}
+        for old_key, new_key in COLUMN_RENAMES.items():
+            value = record.get(old_key)
+            row[new_key] = None if value != value else value  # NaN is the only value not equal to itself
+        cleaned.append(row)
+    cleaned.sort(key=lambda r: (r['bankName'] or '', r['termMonths'] is None, r['termMonths'] or 0))
+    return cleaned
+
+# Largest number of records sent in a single upsert request
+UPLOAD_CHUNK_SIZE = 500
+
+# The columns that identify one rate row of an institution (plus bankName). The
+# upsert needs the matching unique constraint on public-rates, created by
+# supabase/migrations/20261015000000_public_rates_rate_key.sql
+RATE_KEY = ('fdType', 'termMonths', 'payoutSchedule')
+
+def _upload_chunks(records):
+    return (records[i:i + UPLOAD_CHUNK_SIZE] for i in range(0, len(records), UPLOAD_CHUNK_SIZE))
+
+async def replace_institution_rates(supabase_client, institution_name, records):
+    """
+    Makes an institution's rows in public-rates match `records` (already cleaned).
+    The upserts (UPLOAD_CHUNK_SIZE rows per request) and the lookup of the rows
+    already stored go out together, and only rows whose key wasn't scraped this
+    time are deleted afterwards, so an unchanged product list costs one round trip.
+
+    Raises ValueError, before writing anything, if two records share a key.
+    Records without a term can't be upserted: Postgres never treats NULLs as equal,
+    so they would be inserted again on every run. The institution's stored NULL-term
+    rows are deleted and these records inserted instead. Returns the records written.
+    """
+    keyed, unkeyed, duplicates = {}, [], []
+    for r in records:
+        if r['termMonths'] is None:
+            unkeyed.append(r)
+            continue
+        key = tuple(r[col] for col in RATE_KEY)
+        if key in keyed:
+            duplicates.append(key)
+        keyed[key] = r
+    # Two records with one key would have to overwrite each other, silently losing a
+    # rate, so fail this institution's upload (its stored rows are left untouched)
+    if duplicates:
+        raise ValueError(f"'{institution_name}' scraped more than one record for {sorted(set(duplicates))}")
+    records = list(keyed.values())
+
+    existing_call = asyncio.to_thread(
+        supabase_client.from_("public-rates")
+        .select("id, " + ", ".join(RATE_KEY))
+        .eq("bankName", institution_name)
+        .execute
+    )
+    # returning="minimal" skips echoing every row back; count="exact" still
+    # reports how many rows each request wrote
+    upsert_calls = [
+        asyncio.to_thread(
+            supabase_client.from_("public-rates")
+            .upsert(chunk, on_conflict="bankName," + ",".join(RATE_KEY), returning="minimal", count="exact")
+            .execute
+        )
+        for chunk in _upload_chunks(records)
+    ]
+    existing_response, *write_responses = await asyncio.gather(existing_call, *upsert_calls)
+
+    # Rows the upsert just wrote (whether or not the lookup saw them) have a new key,
+    # so only genuinely dropped products and the old NULL-term rows end up here
+    stale_ids = [
+        row['id'] for row in existing_response.data or []
+        if row['termMonths'] is None or tuple(row[col] for col in RATE_KEY) not in keyed
+    ]
+    if stale_ids:
+        logger.info("    - Deleting %d stale records for '%s'...", len(stale_ids), institution_name)
+    # The lookup finished before these inserts started, so the delete can't hit them
+    insert_calls = [
+        asyncio.to_thread(
+            supabase_client.from_("public-rates").insert(chunk, returning="minimal", count="exact").execute
+        )
+        for chunk in _upload_chunks(unkeyed)
+    ]
+    delete_calls = [
+        asyncio.to_thread(
+            supabase_client.from_("public-rates").delete(returning="minimal").in_("id", stale_ids).execute
+        )
+    ] if stale_ids else []
+    write_responses += (await asyncio.gather(*insert_calls, *delete_calls))[:len(insert_calls)]
+
+    records += unkeyed
+    written = sum(response.count or 0 for response in write_responses)
+    if written != len(records):
+        logger.warning("--- WARNING (Upload): Mismatch for '%s'. Expected %d, upserted %d.", institution_name, len(records), written)
+    return records
+
+def _orjson_dumps(obj, **kwargs):
+    # httpx passes stdlib json.dumps options and expects a str back; orjson's
+    # output is already compact UTF-8, so the options don't apply
+    return orjson.dumps(obj).decode()
+
+def use_orjson_encoder():
+    """
+    Makes httpx (which the Supabase client sends requests through) encode JSON
+    request bodies with orjson instead of the slower stdlib json module.
+    json_dumps is private to httpx, so requirements.txt pins httpx to the releases
+    that have it; on any other version this logs a warning and keeps stdlib json.
+    """
+    if not hasattr(httpx_content, 'json_dumps'):
+        logger.warning("httpx %s has no json_dumps hook; request bodies use stdlib json.", httpx.__version__)
+        return
+    httpx_content.json_dumps = _orjson_dumps
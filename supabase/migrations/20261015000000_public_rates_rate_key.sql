@@ -0,0 +1,23 @@
+-- The scrapers upsert public-rates on (bankName, fdType, termMonths, payoutSchedule)
+-- (RATE_KEY in scraper/utils.py). PostgREST rejects an upsert whose on_conflict
+-- columns have no unique constraint (42P10), so this must exist before they run.
+--
+-- NULLs stay distinct: a product without a term (termMonths is NULL) is never
+-- upserted. The scrapers delete an institution's NULL-term rows and insert the
+-- new ones instead, so different products that both lack a term are all kept.
+
+-- Data change: the old delete-then-insert uploads could store the same key twice (e.g.
+-- DFCC, whose separate "... FD Rates" tables were all typed 'Standard'). Only the row
+-- with the highest id per key is kept here. Those institutions are rewritten in full
+-- on their next successful scrape, and DFCC now types each table by its heading.
+delete from "public-rates" a
+using "public-rates" b
+where a."bankName" = b."bankName"
+  and a."fdType" = b."fdType"
+  and a."termMonths" = b."termMonths"
+  and a."payoutSchedule" = b."payoutSchedule"
+  and a.id < b.id;
+
+alter table "public-rates"
+  add constraint "public-rates_rate_key"
+  unique ("bankName", "fdType", "termMonths", "payoutSchedule");